@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -20,6 +23,7 @@ if str(SRC_ROOT) not in sys.path:
 
 from backend.vector_db.config import PGVECTOR_TABLE  # noqa: E402
 from backend.vector_db.vector_db_helper import (  # noqa: E402
+    bulk_load,
     create_doc_upsert,
     ensure_schema,
     get_pgvector_client,
@@ -125,6 +129,11 @@ def load_file_payload(file_path: Path) -> Dict[str, Any]:
     return {"content": text}
 
 
+def file_fingerprint(file_path: Path) -> str:
+    # Content digest (not mtime) so fresh checkouts of unchanged data are not re-embedded.
+    return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+
 def build_dsn() -> str:
     dsn = os.environ.get("POSTGRES_DSN") or os.environ.get("DATABASE_URL")
     if dsn:
@@ -145,20 +154,21 @@ def fetch_entity_map(dsn: str) -> Dict[str, int]:
     return {str(row[0]): int(row[1]) for row in rows}
 
 
-def fetch_existing_source_paths(dsn: str) -> Set[str]:
+def fetch_existing_source_fingerprints(dsn: str) -> Dict[str, Optional[str]]:
     table = safe_ident(PGVECTOR_TABLE)
     with psycopg.connect(dsn) as conn:
         with conn.cursor() as cur:
             cur.execute(
                 f"""
-                SELECT DISTINCT source_id
+                SELECT source_id, MAX(metadata->>'source_fingerprint')
                 FROM {table}
                 WHERE source_id IS NOT NULL
-                  AND source_id LIKE '%%/%%';
+                  AND source_id LIKE '%%/%%'
+                GROUP BY source_id;
                 """
             )
             rows = cur.fetchall()
-    return {str(row[0]) for row in rows if row and row[0]}
+    return {str(row[0]): (str(row[1]) if row[1] else None) for row in rows if row and row[0]}
 
 
 def delete_stale_source_paths(dsn: str, stale_paths: List[str], batch_size: int = 1000) -> int:
@@ -179,6 +189,22 @@ def delete_stale_source_paths(dsn: str, stale_paths: List[str], batch_size: int
     return deleted
 
 
+def upsert_target_file(client: Any, target: Tuple[Path, str, str, int, str]) -> bool:
+    file_path, rel_file, collection, entity_id, fingerprint = target
+    payload = load_file_payload(file_path)
+    if not backfill_content_if_missing(payload):
+        return False
+
+    payload["entity_id"] = str(entity_id)
+    payload["source_path"] = rel_file
+    payload["collection"] = collection
+    payload["file_name"] = file_path.name
+    payload["source_fingerprint"] = fingerprint
+
+    create_doc_upsert(client, collection, payload)
+    return True
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
@@ -200,7 +226,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--force-reembed-all",
         action="store_true",
-        help="Re-embed all files even when source_path already exists in documents",
+        help="Re-embed all files even when source_path exists with an unchanged fingerprint",
     )
     parser.add_argument(
         "--limit-files",
@@ -208,6 +234,27 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional processing limit for smoke runs",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("REBUILD_VECTOR_WORKERS", "4")),
+        help="Concurrent file upserts; embedding/DB calls are I/O bound (default: 4)",
+    )
+    parser.add_argument(
+        "--defer-index",
+        action="store_true",
+        help=(
+            "Drop the ivfflat embedding index during large upserts and rebuild it at the end. "
+            "Live searches fall back to sequential scans until the rebuild finishes, "
+            "so only use this when the table is not serving traffic"
+        ),
+    )
+    parser.add_argument(
+        "--bulk-index-threshold",
+        type=int,
+        default=int(os.environ.get("REBUILD_BULK_INDEX_THRESHOLD", "500")),
+        help="With --defer-index, only drop the index when upserting at least this many files (default: 500)",
+    )
     return parser.parse_args()
 
 
@@ -238,7 +285,8 @@ def main() -> None:
         desired_files_all.append((file_path, rel_file, collection, entity_id))
 
     desired_source_paths = {item[1] for item in desired_files_all}
-    existing_source_paths = fetch_existing_source_paths(dsn)
+    existing_fingerprints = fetch_existing_source_fingerprints(dsn)
+    existing_source_paths = set(existing_fingerprints)
 
     stale_paths = sorted(existing_source_paths - desired_source_paths)
     if stale_paths and not args.no_cleanup_stale:
@@ -246,10 +294,17 @@ def main() -> None:
     else:
         deleted_rows = 0
 
-    if args.force_reembed_all:
-        target_files = list(desired_files_all)
-    else:
-        target_files = [item for item in desired_files_all if item[1] not in existing_source_paths]
+    target_files: List[Tuple[Path, str, str, int, str]] = []
+    changed_files = 0
+    for file_path, rel_file, collection, entity_id in desired_files_all:
+        fingerprint = file_fingerprint(file_path)
+        if not args.force_reembed_all and rel_file in existing_fingerprints:
+            stored = existing_fingerprints[rel_file]
+            # Rows written before fingerprints existed have none; treat them as unchanged.
+            if stored is None or stored == fingerprint:
+                continue
+            changed_files += 1
+        target_files.append((file_path, rel_file, collection, entity_id, fingerprint))
 
     if args.limit_files is not None:
         target_files = target_files[: max(0, int(args.limit_files))]
@@ -263,31 +318,44 @@ def main() -> None:
     print(f"existing_source_paths: {len(existing_source_paths)}")
     print(f"stale_source_paths: {len(stale_paths)}")
     print(f"stale_rows_deleted: {deleted_rows}")
+    print(f"changed_source_paths: {changed_files}")
     print(f"files_to_upsert: {len(target_files)}")
+    if not target_files:
+        print("corpus fingerprint unchanged; nothing to upsert")
 
     processed = 0
     skipped_no_body = 0
     failed = 0
 
-    for file_path, rel_file, collection, entity_id in target_files:
-        try:
-            payload = load_file_payload(file_path)
-            if not backfill_content_if_missing(payload):
-                skipped_no_body += 1
-                continue
-
-            payload["entity_id"] = str(entity_id)
-            payload["source_path"] = rel_file
-            payload["collection"] = collection
-            payload["file_name"] = file_path.name
-
-            create_doc_upsert(client, collection, payload)
-            processed += 1
-            if processed % 50 == 0:
-                print(f"upserted_files: {processed}/{len(target_files)}")
-        except Exception as e:
-            failed += 1
-            print(f"[ERROR] upsert failed: {rel_file} ({e})")
+    workers = max(1, int(args.workers))
+    print(f"workers: {workers}")
+
+    # With --defer-index, large re-embeds load without the ivfflat index and build it once at the end.
+    # Off by default: dropping the index degrades searches on the live table while the rebuild runs.
+    defer_index = args.defer_index and len(target_files) >= max(1, int(args.bulk_index_threshold))
+    print(f"defer_embedding_index: {defer_index}")
+
+    # Each upsert opens its own connection; counters are only touched on the main thread.
+    with bulk_load(client) if defer_index else nullcontext():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_map = {
+                executor.submit(upsert_target_file, client, target): target[1]
+                for target in target_files
+            }
+            for future in as_completed(future_map):
+                rel_file = future_map[future]
+                try:
+                    upserted = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"[ERROR] upsert failed: {rel_file} ({e})")
+                    continue
+                if not upserted:
+                    skipped_no_body += 1
+                    continue
+                processed += 1
+                if processed % 50 == 0:
+                    print(f"upserted_files: {processed}/{len(target_files)}")
 
     print("done")
     print(f"processed: {processed}")
@@ -1,4 +1,4 @@
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -9,7 +9,7 @@ def get_listing_urls(page=1):
     하나의 목록 페이지에서 각 공지의 상세 링크를 추출
     """
     url = "https://cs.kaist.ac.kr/bbs/airesearch"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -31,7 +31,7 @@ def parse_article(url):
     """
     상세 페이지에서 제목, 날짜(문자열), 본문을 파싱해서 반환
     """
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -1,4 +1,4 @@
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -11,7 +11,7 @@ def get_listing_urls():
     연구실 목록 페이지에서 labView 링크를 절대 URL로 반환
     """
     url = f"{BASE_DOMAIN}/research/labs"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -34,7 +34,7 @@ def parse_lab(url):
     """
     labView 상세 페이지에서 필요한 필드들을 파싱해 dict로 반환
     """
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
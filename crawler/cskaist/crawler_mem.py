@@ -1,4 +1,4 @@
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -12,7 +12,7 @@ def get_staff_urls():
     상세 프로필 URL 목록을 반환합니다.
     """
     url = f"{BASE_DOMAIN}/people/staff"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -31,7 +31,7 @@ def parse_staff(url):
     """
     상세 프로필 페이지에서 정보를 파싱해 딕셔너리로 반환합니다.
     """
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -2,7 +2,7 @@
     
 
 
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -13,7 +13,7 @@ def get_listing_urls(page):
     하나의 목록 페이지에서 각 공지의 상세 링크를 추출
     """
     url = f"https://cs.kaist.ac.kr/board/list?page={page}&bbs_id=notice"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -37,7 +37,7 @@ def parse_article(url):
     """
     상세 페이지에서 제목, 날짜, 본문을 파싱해서 반환
     """
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -1,4 +1,4 @@
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -8,7 +8,7 @@ BASE_DOMAIN = "https://cs.kaist.ac.kr"
 
 def get_professor_urls():
     url = f"{BASE_DOMAIN}/people/faculty"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -23,7 +23,7 @@ def get_professor_urls():
     return urls
 
 def parse_professor(url):
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
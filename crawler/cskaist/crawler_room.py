@@ -1,4 +1,4 @@
-import requests
+from csweb_http import SESSION
 from bs4 import BeautifulSoup
 import re
 import json
@@ -12,7 +12,7 @@ def crawl_seminar_rooms(i, delay=0.1):
     세미나실 목록 페이지에서 각 방의 예약 버튼을 찾아
     roomnum, 이름, 설비 정보를 한 번에 파싱합니다.
     """
-    resp = requests.get(LIST_URL + i)
+    resp = SESSION.get(LIST_URL + i)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, 'html.parser')
 
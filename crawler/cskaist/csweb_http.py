@@ -0,0 +1,13 @@
+# csweb_http.py
+"""
+◼️ cs.kaist.ac.kr 크롤러들이 함께 쓰는 keep-alive HTTP 세션
+◼️ main.py에서 여러 크롤러를 연달아 실행해도 TCP/TLS 연결을 재사용한다.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
@@ -1,15 +1,44 @@
 """
 llm 모듈: OpenAI 기반 체커, 파서 등
+
+하위 모듈은 속성에 처음 접근할 때 불러온다(PEP 562).
+체커만 필요한 경우에도 psycopg/벡터 검색기까지 함께 import되지 않도록 하기 위함이다.
 """
-from .inputChecker import OpenAIInputChecker
-from .inputNormalizer import OpenAIInputNormalizer
-
-from .vector_searcher import VectorSearcher
-from .openai_chatbot import OpenAIChatBot
-from .hierarchical_node_search import (
-    HierarchicalNodeSearchOrchestrator,
-    HierarchicalSearchResult,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_ATTRS = {
+    "OpenAIInputChecker": ".inputChecker",
+    "OpenAIInputNormalizer": ".inputNormalizer",
+    "VectorSearcher": ".vector_searcher",
+    "OpenAIChatBot": ".openai_chatbot",
+    "HierarchicalNodeSearchOrchestrator": ".hierarchical_node_search",
+    "HierarchicalSearchResult": ".hierarchical_node_search",
+}
+
+if TYPE_CHECKING:
+    from .inputChecker import OpenAIInputChecker
+    from .inputNormalizer import OpenAIInputNormalizer
+    from .vector_searcher import VectorSearcher
+    from .openai_chatbot import OpenAIChatBot
+    from .hierarchical_node_search import (
+        HierarchicalNodeSearchOrchestrator,
+        HierarchicalSearchResult,
+    )
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "OpenAIInputChecker",
@@ -7,7 +7,7 @@ from __future__ import annotations
 import json
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -16,6 +16,8 @@ from typing import Any, Dict, List, Optional, Set
 import openai
 
 from .vector_searcher import VectorSearcher
+from .openai_client import get_openai_client
+from .response_cache import LLMResponseCache
 
 
 DEFAULT_LLM_ROOT = Path(__file__).resolve().parents[3]
@@ -29,6 +31,11 @@ NODE_TOP_K_DEFAULT = 20
 FINAL_DOC_LIMIT_DEFAULT = 60
 MAX_ROOT_NODES_DEFAULT = 4
 
+# 노드 랭킹 루프에서 자식마다 호출되므로 정규식을 모듈 로드 시 한 번만 컴파일한다.
+QUERY_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9가-힣_+.-]{2,}")
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", flags=re.DOTALL)
+JSON_BLOCK_PATTERN = re.compile(r"```json\s*(\{.*?\})\s*```", flags=re.DOTALL)
+
 
 PLANNER_SYSTEM_PROMPT = """
 너는 계층형 검색 루트 노드 선택기다.
@@ -81,7 +88,7 @@ NODE_JUDGE_SYSTEM_PROMPT = """
 """.strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityNode:
     entity_id: str
     name: str
@@ -96,7 +103,7 @@ class EntityNode:
     entity_json: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Level0Catalog:
     generated_at: str
     root_path: str
@@ -105,14 +112,14 @@ class Level0Catalog:
     entities_by_id: Dict[str, EntityNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class RootNodePlan:
     entity_id: str
     keywords: List[str]
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSearchResult:
     doc_ids: List[str] = field(default_factory=list)
     score_by_doc_id: Dict[str, float] = field(default_factory=dict)
@@ -121,7 +128,7 @@ class NodeSearchResult:
     used_keywords: Set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class HierarchicalSearchResult:
     final_doc_ids: List[str] = field(default_factory=list)
     trace: List[Dict[str, Any]] = field(default_factory=list)
@@ -142,7 +149,7 @@ class Level0CatalogLoader:
 
     @staticmethod
     def _extract_json_block(text: str) -> Optional[Dict[str, Any]]:
-        matched = re.search(r"```json\s*(\{.*?\})\s*```", text, flags=re.DOTALL)
+        matched = JSON_BLOCK_PATTERN.search(text)
         if not matched:
             return None
         raw_json = matched.group(1).strip()
@@ -163,7 +170,7 @@ class Level0CatalogLoader:
                 return parsed
         except json.JSONDecodeError:
             pass
-        matched = re.search(r"\{.*\}", raw, flags=re.DOTALL)
+        matched = JSON_OBJECT_PATTERN.search(raw)
         if not matched:
             return None
         try:
@@ -536,6 +543,8 @@ class NodeSearchPlannerLLM:
         self.model = model
         self.max_root_nodes = max(1, max_root_nodes)
         self.debug = debug
+        # 같은 질의·시드 키워드·날짜 필터면 계획 결과도 같으므로 재질문 시 planner 호출을 생략한다.
+        self.response_cache = LLMResponseCache()
 
     @staticmethod
     def _extract_json_object(text: str) -> Optional[Dict[str, Any]]:
@@ -548,7 +557,7 @@ class NodeSearchPlannerLLM:
                 return parsed
         except json.JSONDecodeError:
             pass
-        matched = re.search(r"\{.*\}", raw, flags=re.DOTALL)
+        matched = JSON_OBJECT_PATTERN.search(raw)
         if not matched:
             return None
         try:
@@ -570,7 +579,7 @@ class NodeSearchPlannerLLM:
 
     @staticmethod
     def _simple_query_keywords(query: str, max_keywords: int = 5) -> List[str]:
-        tokens = re.findall(r"[A-Za-z0-9가-힣_+.-]{2,}", query or "")
+        tokens = QUERY_TOKEN_PATTERN.findall(query or "")
         out: List[str] = []
         for token in tokens:
             for candidate in (token, NodeSearchPlannerLLM._normalize_keyword(token)):
@@ -657,37 +666,48 @@ class NodeSearchPlannerLLM:
                 }
             )
 
+        # 카탈로그처럼 질의와 무관한 큰 블록을 앞에 두어 요청 간 프롬프트 접두사가 같게 유지되도록 한다.
+        # (OpenAI 프롬프트 캐싱은 동일한 접두사에만 적용된다.)
         payload = {
+            "top_level_entities": enriched_top_level_entities,
+            "relation_types": catalog.relation_types,
             "query": query,
             "seed_keywords": seed,
             "date_filter": {
                 "start_date": start_date.isoformat() if start_date else None,
                 "end_date": end_date.isoformat() if end_date else None,
             },
-            "top_level_entities": enriched_top_level_entities,
-            "relation_types": catalog.relation_types,
         }
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": PLANNER_SYSTEM_PROMPT.replace(
-                            "{max_root_nodes}",
-                            str(self.max_root_nodes),
-                        ),
-                    },
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
-                ],
-                temperature=0.1,
-            )
-            raw = (response.choices[0].message.content or "").strip()
-            parsed = self._extract_json_object(raw) or {}
-        except Exception as e:
-            if self.debug:
-                print(f"⚠️ NodeSearchPlannerLLM 실패: {e}")
-            parsed = {}
+        user_content = json.dumps(payload, ensure_ascii=False)
+        cache_key = (self.model, self.max_root_nodes, user_content)
+        parsed = self.response_cache.get(cache_key)
+        if parsed is None:
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": PLANNER_SYSTEM_PROMPT.replace(
+                                "{max_root_nodes}",
+                                str(self.max_root_nodes),
+                            ),
+                        },
+                        {"role": "user", "content": user_content},
+                    ],
+                    temperature=0.1,
+                    response_format={"type": "json_object"},
+                    # 카탈로그 접두사가 같은 요청끼리 같은 캐시로 라우팅되도록 고정 키를 준다.
+                    prompt_cache_key="hierarchy-planner",
+                )
+                raw = (response.choices[0].message.content or "").strip()
+                parsed = self._extract_json_object(raw) or {}
+                if parsed:
+                    self.response_cache.set(cache_key, parsed)
+            except Exception as e:
+                if self.debug:
+                    print(f"⚠️ NodeSearchPlannerLLM 실패: {e}")
+                parsed = {}
 
         plans: List[RootNodePlan] = []
         raw_nodes = parsed.get("nodes", [])
@@ -748,6 +768,8 @@ class RecursiveNodeSearcher:
         self.node_top_k = max(1, node_top_k)
         self.final_doc_limit = max(1, final_doc_limit)
         self.debug = debug
+        # 노드 판단 입력에는 로컬 벡터 검색 결과까지 포함되므로, 문서가 바뀌면 자연히 다른 키가 된다.
+        self.response_cache = LLMResponseCache()
 
     def _limit_children(self, items: List[Any]) -> List[Any]:
         if self.max_children_per_node is None:
@@ -765,7 +787,7 @@ class RecursiveNodeSearcher:
                 return parsed
         except json.JSONDecodeError:
             pass
-        matched = re.search(r"\{.*\}", raw, flags=re.DOTALL)
+        matched = JSON_OBJECT_PATTERN.search(raw)
         if not matched:
             return None
         try:
@@ -803,11 +825,14 @@ class RecursiveNodeSearcher:
 
     @staticmethod
     def _dedupe_keep_order(items: List[str], max_items: int) -> List[str]:
+        # doc_id 목록은 수백 개까지 늘어날 수 있으므로 set으로 한 번에 중복을 거른다.
         out: List[str] = []
+        seen: Set[str] = set()
         for item in items:
             cleaned = str(item).strip()
-            if not cleaned or cleaned in out:
+            if not cleaned or cleaned in seen:
                 continue
+            seen.add(cleaned)
             out.append(cleaned)
             if len(out) >= max_items:
                 break
@@ -847,7 +872,7 @@ class RecursiveNodeSearcher:
     def _tokenize(text: str) -> Set[str]:
         return {
             token.lower()
-            for token in re.findall(r"[A-Za-z0-9가-힣_+.-]{2,}", text or "")
+            for token in QUERY_TOKEN_PATTERN.findall(text or "")
             if len(token) >= 2
         }
 
@@ -908,15 +933,10 @@ class RecursiveNodeSearcher:
         start_date: Optional[date],
         end_date: Optional[date],
     ) -> Dict[str, Any]:
+        # 엔티티 설명/하위 엔티티처럼 노드별로 고정된 부분을 앞에 두어 프롬프트 캐싱 접두사를 늘린다.
         payload = {
-            "query": query,
-            "depth": depth,
             "max_depth": self.max_depth,
             "max_children_per_node": self.max_children_per_node,
-            "date_filter": {
-                "start_date": start_date.isoformat() if start_date else None,
-                "end_date": end_date.isoformat() if end_date else None,
-            },
             "current_entity": {
                 "entity_id": entity.entity_id,
                 "name": entity.name,
@@ -926,8 +946,6 @@ class RecursiveNodeSearcher:
                 "entity_md": self._compact_text(entity.entity_md_text, max_chars=1200),
                 "entity_json": entity.entity_json,
             },
-            "keywords": keywords,
-            "local_vector_hits": self._build_local_hit_summary(local_hits),
             "child_entities": [
                 {
                     "entity_id": child.entity_id,
@@ -939,19 +957,37 @@ class RecursiveNodeSearcher:
                 }
                 for child in child_entities
             ],
+            "query": query,
+            "depth": depth,
+            "date_filter": {
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+            },
+            "keywords": keywords,
+            "local_vector_hits": self._build_local_hit_summary(local_hits),
         }
 
+        user_content = json.dumps(payload, ensure_ascii=False)
+        cache_key = (self.model, user_content)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": NODE_JUDGE_SYSTEM_PROMPT},
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+                    {"role": "user", "content": user_content},
                 ],
                 temperature=0.1,
+                response_format={"type": "json_object"},
+                prompt_cache_key=f"hierarchy-node:{entity.entity_id}",
             )
             raw = (response.choices[0].message.content or "").strip()
             parsed = self._extract_json_object(raw)
+            if parsed:
+                self.response_cache.set(cache_key, parsed)
             return parsed if parsed else {}
         except Exception as e:
             if self.debug:
@@ -1145,8 +1181,11 @@ class RecursiveNodeSearcher:
             exclude_set = set(exclude_doc_ids or [])
             exclude_set.update(merged_doc_ids)
             child_jobs = self._limit_children(next_children)
+            child_exclude_doc_ids = list(exclude_set)
             with ThreadPoolExecutor(max_workers=min(self.max_workers, len(child_jobs))) as executor:
-                future_map = {
+                # 모든 자식 작업을 먼저 제출한 뒤 제출 순서대로 결과를 모은다.
+                # 완료 순서(as_completed)에 따라 trace/동점 문서 순서가 흔들리지 않게 한다.
+                futures = [
                     executor.submit(
                         self._search_node,
                         query=query,
@@ -1155,11 +1194,11 @@ class RecursiveNodeSearcher:
                         depth=depth + 1,
                         start_date=start_date,
                         end_date=end_date,
-                        exclude_doc_ids=list(exclude_set),
-                    ): job
+                        exclude_doc_ids=child_exclude_doc_ids,
+                    )
                     for job in child_jobs
-                }
-                for future in as_completed(future_map):
+                ]
+                for future in futures:
                     child_result = future.result()
                     merged_doc_ids.extend(child_result.doc_ids)
                     for doc_id, score in child_result.score_by_doc_id.items():
@@ -1197,7 +1236,7 @@ class RecursiveNodeSearcher:
             return HierarchicalSearchResult()
 
         with ThreadPoolExecutor(max_workers=min(self.max_workers, len(root_plans))) as executor:
-            future_map = {
+            futures = [
                 executor.submit(
                     self._search_node,
                     query=query,
@@ -1207,11 +1246,10 @@ class RecursiveNodeSearcher:
                     start_date=start_date,
                     end_date=end_date,
                     exclude_doc_ids=[],
-                ): plan
+                )
                 for plan in root_plans
-            }
-            for future in as_completed(future_map):
-                plan = future_map[future]
+            ]
+            for plan, future in zip(root_plans, futures):
                 node_result = future.result()
                 overall_trace.append(
                     {
@@ -1255,7 +1293,7 @@ class HierarchicalNodeSearchOrchestrator:
         max_root_nodes: Optional[int] = None,
         debug: bool = False,
     ):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key=api_key)
         self.vector_searcher = vector_searcher
         self.child_model = child_model
         self.debug = debug
@@ -2,12 +2,29 @@
 OpenAI 기반 입력 검증 및 정규화 모듈
 """
 
-import openai
+import copy
 import json
 import os
+import re
 import traceback
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from .config import soc_words_json
+from .response_cache import LLMResponseCache, normalize_cache_text
+from .openai_client import get_openai_client
+
+
+# JSON 파싱 실패 시 is_valid 값만 찾는다. 설명 문장 속 "true" 같은 단어에 통과되지 않도록
+# is_valid 키에 붙은 true이거나, 응답 전체가 true 한 단어일 때만 인정한다.
+IS_VALID_TRUE_PATTERN = re.compile(r'"?is_valid"?\s*:\s*"?\s*true|^\W*true\W*$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """설정 파일을 경로별로 한 번만 파싱한다 (실패는 캐시되지 않는다)."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class OpenAIInputChecker:
     """OpenAI API를 사용한 입력 검증 클래스"""
@@ -21,8 +38,10 @@ class OpenAIInputChecker:
             model (str): 사용할 모델
             config_path (str): inputchecker.json 파일 경로
         """
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key=api_key)
         self.model = model
+        # 워밍업/반복 질문에 대해 같은 분류 호출을 다시 보내지 않도록 성공 응답을 캐시한다.
+        self.response_cache = LLMResponseCache()
         
         # 기본 config 파일 경로 설정
         if config_path is None:
@@ -33,6 +52,14 @@ class OpenAIInputChecker:
         
         # examples를 먼저 설정
         self.examples = self.config.get('examples', [])
+        # examples는 초기화 후 바뀌지 않으므로 few-shot 메시지를 한 번만 직렬화해 둔다.
+        self.few_shot_messages = self._build_few_shot_messages(self.examples)
+        # 예시 전체는 시스템 프롬프트에 이미 들어 있으므로, 대화형 few-shot은 질문과 가까운 일부만 보낸다.
+        # (0 이하이면 모든 예시를 보낸다.)
+        self.few_shot_top_k = int(os.getenv("CHECKER_FEW_SHOT_TOP_K", "4"))
+        self.example_bigrams = [self._char_bigrams(example['input']) for example in self.examples]
+        # 출력 형식/예시 블록은 요청과 무관하므로 미리 만들어 두고 단어 정보만 요청마다 붙인다.
+        self.system_prompt_suffix = self._build_system_prompt_suffix()
         
         # 시스템 프롬프트 설정
     
@@ -47,8 +74,8 @@ class OpenAIInputChecker:
             Dict[str, Any]: 설정 데이터
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # 인스턴스가 설정을 수정해도 캐시된 원본이 바뀌지 않도록 복사본을 쓴다.
+            return copy.deepcopy(_read_config_file(os.path.abspath(config_path)))
         except Exception as e:
             print(f"설정 파일 로드 실패: {e}")
             # 기본 설정 반환
@@ -58,6 +85,84 @@ class OpenAIInputChecker:
                 "examples": []
             }
 
+    @staticmethod
+    def _build_few_shot_messages(examples: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        few-shot 예시를 user/assistant 메시지 쌍으로 변환
+        
+        Returns:
+            List[Dict[str, str]]: 요청마다 재사용할 예시 메시지 목록
+        """
+        messages: List[Dict[str, str]] = []
+        for example in examples:
+            messages.append({"role": "user", "content": example['input']})
+            messages.append({"role": "assistant", "content": json.dumps(example['output'], ensure_ascii=False)})
+        return messages
+
+    @staticmethod
+    def _char_bigrams(text: str) -> frozenset:
+        """공백을 제거한 문자열의 글자 bigram 집합 (한국어 질문 간 유사도 계산용)"""
+        compact = "".join((text or "").split())
+        return frozenset(compact[i:i + 2] for i in range(len(compact) - 1))
+
+    def _select_few_shot_messages(self, user_message: str) -> List[Dict[str, str]]:
+        """
+        사용자 메시지와 글자 bigram이 많이 겹치는 few-shot 예시 top-k 선택
+        
+        true/false 한쪽 예시만 남으면 분류가 치우칠 수 있어 빠진 레이블의 예시를 하나 덧붙인다.
+        
+        Args:
+            user_message (str): 사용자 메시지
+            
+        Returns:
+            List[Dict[str, str]]: 원래 순서를 유지한 예시 메시지 목록
+        """
+        top_k = self.few_shot_top_k
+        if top_k <= 0 or len(self.examples) <= top_k:
+            return self.few_shot_messages
+
+        query_bigrams = self._char_bigrams(user_message)
+
+        def score(index: int) -> float:
+            example_bigrams = self.example_bigrams[index]
+            union = len(query_bigrams | example_bigrams)
+            return len(query_bigrams & example_bigrams) / union if union else 0.0
+
+        ranked = sorted(range(len(self.examples)), key=lambda index: (-score(index), index))
+        selected = ranked[:top_k]
+        labels = {str(self.examples[index]['output'].get('is_valid')) for index in selected}
+        # 빠진 레이블은 가장 가까운 예시를 덧붙인다(top-k 안의 예시는 그대로 둔다).
+        for index in ranked[top_k:]:
+            label = str(self.examples[index]['output'].get('is_valid'))
+            if label not in labels:
+                selected.append(index)
+                labels.add(label)
+
+        messages: List[Dict[str, str]] = []
+        for index in sorted(selected):
+            messages.extend(self.few_shot_messages[2 * index:2 * index + 2])
+        return messages
+
+    def _build_system_prompt_suffix(self) -> str:
+        """
+        시스템 프롬프트 중 요청과 무관한 출력 형식/예시 블록 구성
+        
+        Returns:
+            str: 고정 블록
+        """
+        output_format = self.config.get('output_format', {})
+
+        parts = [f"출력 형식:\n{json.dumps(output_format, ensure_ascii=False, indent=2)}\n\n"]
+        
+        # 예시가 있다면 추가
+        if self.examples:
+            parts.append("예시:\n")
+            for example in self.examples:
+                parts.append(f"입력: {example['input']}\n")
+                parts.append(f"출력: {json.dumps(example['output'], ensure_ascii=False)}\n\n")
+        
+        return "".join(parts)
+
     def _build_system_prompt(self, words: json) -> str:
         """
         JSON 설정을 기반으로 시스템 프롬프트 구성
@@ -66,24 +171,13 @@ class OpenAIInputChecker:
             str: 구성된 시스템 프롬프트
         """
         instruction = self.config.get('instruction', '')
-        output_format = self.config.get('output_format', {})
         
         word_info = ""
         if words:
             word_info = "입력에 포함된 다음 단어들의 뜻을 참고하세요:\n"
             word_info += words + "\n\n"
 
-        prompt = f"{instruction} {word_info}\n\n"
-        prompt += f"출력 형식:\n{json.dumps(output_format, ensure_ascii=False, indent=2)}\n\n"
-        
-        # 예시가 있다면 추가
-        if self.examples:
-            prompt += "예시:\n"
-            for example in self.examples:
-                prompt += f"입력: {example['input']}\n"
-                prompt += f"출력: {json.dumps(example['output'], ensure_ascii=False)}\n\n"
-        
-        return prompt
+        return f"{instruction} {word_info}\n\n{self.system_prompt_suffix}"
     
     def extract_word(self,user_message: str) -> json:
         """
@@ -103,25 +197,30 @@ class OpenAIInputChecker:
         
         return json.dumps(words, ensure_ascii=False, indent=2)
 
-    def process_query(self, user_message: str) -> Dict[str, Any]:
+    def process_query(self, user_message: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """
         사용자 쿼리의 유효성 검사
         
         Args:
             user_message (str): 사용자 메시지
+            system_prompt (Optional[str]): 이번 호출에 쓸 시스템 프롬프트(없으면 self.system_prompt)
             
         Returns:
-            Dict[str, Any]: 검증 결과
+            Dict[str, Any]: 검증 결과 (is_valid는 bool)
         """
         try:
             # 메시지 구성 - few-shot learning을 위한 예시 포함
 
-            messages = [{"role": "system", "content": self.system_prompt}]
-            
+            if system_prompt is None:
+                system_prompt = self.system_prompt
+            cache_key = (self.model, system_prompt, normalize_cache_text(user_message))
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             # 예시를 few-shot learning으로 추가 (더 나은 성능을 위해)
-            for example in self.examples:  # 최대 3개 예시만 사용
-                messages.append({"role": "user", "content": example['input']})
-                messages.append({"role": "assistant", "content": json.dumps(example['output'], ensure_ascii=False)})
+            messages = [{"role": "system", "content": system_prompt}]
+            messages.extend(self._select_few_shot_messages(user_message))
             
             # 실제 사용자 메시지 추가
             messages.append({"role": "user", "content": user_message})
@@ -130,7 +229,9 @@ class OpenAIInputChecker:
                 model=self.model,
                 messages=messages,
                 temperature=0.3,
-                max_tokens=100
+                # 기대 출력은 {"is_valid": "true"} 한 줄(8토큰 안팎)뿐이므로 폭주 생성을 짧게 끊는다.
+                max_tokens=20,
+                response_format={"type": "json_object"},
             )
             
             result_text = response.choices[0].message.content.strip()
@@ -138,19 +239,29 @@ class OpenAIInputChecker:
             # JSON 파싱 시도
             try:
                 result = json.loads(result_text)
-                return result
             except json.JSONDecodeError:
+                result = None
+            if not isinstance(result, dict):
                 # JSON 파싱 실패 시 텍스트에서 true/false 추출
-                if "true" in result_text.lower():
-                    return {"is_valid": "true"}
-                else:
-                    return {"is_valid": "false"}
+                result = {"is_valid": IS_VALID_TRUE_PATTERN.search(result_text) is not None}
+            else:
+                # 모델이 "true"/"True"/true 중 무엇으로 답하든 파싱 시점에 한 번만 bool로 맞춘다.
+                result["is_valid"] = self._parse_is_valid(result.get("is_valid", True))
+            # 예외로 인한 기본값은 일시적 실패일 수 있으므로 캐시하지 않는다.
+            self.response_cache.set(cache_key, result)
+            return result
                     
         except Exception as e:
             print(f"입력 검증 중 오류: {e}")
             print(f"오류 위치: {traceback.format_exc()}")
             # 기본적으로 유효한 것으로 처리
-            return {"is_valid": "true"}
+            return {"is_valid": True}
+
+    @staticmethod
+    def _parse_is_valid(value: Any) -> bool:
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() == "true"
     
     def check_input(self, user_message: str) -> bool:
         """
@@ -163,6 +274,8 @@ class OpenAIInputChecker:
             bool: 유효성 검사 결과
         """
         words = self.extract_word(user_message)
-        self.system_prompt = self._build_system_prompt(words)
-        result = self.process_query(user_message)
-        return result.get("is_valid", "true") == "true"
+        # 동시에 여러 요청이 들어와도 서로의 프롬프트를 덮어쓰지 않도록 호출 단위로 넘긴다.
+        system_prompt = self._build_system_prompt(words)
+        self.system_prompt = system_prompt
+        result = self.process_query(user_message, system_prompt=system_prompt)
+        return bool(result.get("is_valid", True))
@@ -11,8 +11,9 @@ import re
 import traceback
 from typing import Any, Dict, List, Optional
 
-import openai
 from .config import soc_words_json
+from .response_cache import LLMResponseCache, normalize_cache_text
+from .openai_client import get_openai_client
 
 
 NORMALIZER_SYSTEM_PROMPT = """
@@ -62,6 +63,23 @@ FEW_SHOT_EXAMPLES: List[Dict[str, Any]] = [
     },
 ]
 
+# 호출마다 새로 만들지 않도록 후처리용 상수는 모듈 로드 시 한 번만 구성한다.
+FALLBACK_KEYWORD_STOPWORDS = frozenset({
+    "전산학부", "학교", "관련", "정보", "질문", "문의", "사항",
+    "알려줘", "알려주세요", "궁금해", "궁금합니다", "해주세요", "해줘",
+    "무엇", "뭐", "뭐야", "어떻게", "이번", "최근", "최신",
+})
+FALLBACK_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9가-힣]+")
+ANSWER_MARKERS = (
+    "확인할 수 없습니다",
+    "알 수 없습니다",
+    "죄송",
+    "도움이 되",
+    "확인해보시기 바랍니다",
+    "공식 웹사이트",
+    "공지사항을 통해",
+)
+
 
 class OpenAIInputNormalizer:
     """OpenAI API를 사용한 입력 정규화 클래스"""
@@ -73,11 +91,17 @@ class OpenAIInputNormalizer:
             model: 사용할 모델
             config_path: 하위 호환용 파라미터(현재 사용하지 않음)
         """
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key=api_key)
         self.model = model
         self.system_prompt_template = NORMALIZER_SYSTEM_PROMPT
         self.examples = FEW_SHOT_EXAMPLES
+        # 예시는 고정값이므로 assistant 응답 JSON을 요청마다 다시 직렬화하지 않는다.
+        self.few_shot_messages = self._build_few_shot_messages(self.examples)
         self.source_words = self._load_source_words()
+        # 워밍업/반복 질문에 대해 같은 정규화 호출을 다시 보내지 않도록 성공 응답을 캐시한다.
+        self.response_cache = LLMResponseCache()
+        # 응답 객체 repr은 크고 느리므로 디버그 플래그일 때만 출력하며, 플래그는 초기화 때 한 번만 읽는다.
+        self.debug = os.getenv("DEBUG_OPENAI_NORMALIZER") == "1"
 
     @staticmethod
     def _load_source_words() -> List[Dict[str, Any]]:
@@ -176,18 +200,13 @@ class OpenAIInputNormalizer:
 
     @staticmethod
     def _fallback_keywords(text: str, max_keywords: int = 3) -> List[str]:
-        stopwords = {
-            "전산학부", "학교", "관련", "정보", "질문", "문의", "사항",
-            "알려줘", "알려주세요", "궁금해", "궁금합니다", "해주세요", "해줘",
-            "무엇", "뭐", "뭐야", "어떻게", "이번", "최근", "최신",
-        }
-        tokens = re.findall(r"[A-Za-z0-9가-힣]+", text or "")
+        tokens = FALLBACK_TOKEN_PATTERN.findall(text or "")
         keywords: List[str] = []
         for token in tokens:
             token = token.strip()
             if len(token) < 2:
                 continue
-            if token in stopwords:
+            if token in FALLBACK_KEYWORD_STOPWORDS:
                 continue
             if token in keywords:
                 continue
@@ -198,16 +217,7 @@ class OpenAIInputNormalizer:
 
     @staticmethod
     def _looks_like_answer(output: str) -> bool:
-        answer_markers = [
-            "확인할 수 없습니다",
-            "알 수 없습니다",
-            "죄송",
-            "도움이 되",
-            "확인해보시기 바랍니다",
-            "공식 웹사이트",
-            "공지사항을 통해",
-        ]
-        return any(marker in (output or "") for marker in answer_markers)
+        return any(marker in (output or "") for marker in ANSWER_MARKERS)
 
     def _apply_alias_rewrites(
         self,
@@ -283,11 +293,10 @@ class OpenAIInputNormalizer:
             "keywords": keywords,
         }
 
-    def _build_messages(self, user_message: str) -> List[Dict[str, str]]:
-        system_prompt = self._build_system_prompt(user_message)
-        messages: List[Dict[str, str]] = [{"role": "system", "content": system_prompt}]
-
-        for example in self.examples:
+    @staticmethod
+    def _build_few_shot_messages(examples: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        messages: List[Dict[str, str]] = []
+        for example in examples:
             messages.append({"role": "user", "content": example["input"]})
             messages.append(
                 {
@@ -301,12 +310,22 @@ class OpenAIInputNormalizer:
                     ),
                 }
             )
+        return messages
 
+    def _build_messages(self, user_message: str) -> List[Dict[str, str]]:
+        system_prompt = self._build_system_prompt(user_message)
+        messages: List[Dict[str, str]] = [{"role": "system", "content": system_prompt}]
+        messages.extend(self.few_shot_messages)
         messages.append({"role": "user", "content": user_message})
         return messages
 
     def process_query(self, user_message: str) -> Dict[str, Any]:
         """사용자 쿼리 정규화 + 키워드 추출"""
+        cache_key = (self.model, normalize_cache_text(user_message))
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             matched_aliases = self._collect_matched_aliases(user_message)
             messages = self._build_messages(user_message)
@@ -316,21 +335,25 @@ class OpenAIInputNormalizer:
                 messages=messages,
                 temperature=0.2,
                 max_tokens=220,
+                response_format={"type": "json_object"},
             )
 
-            if os.getenv("DEBUG_OPENAI_NORMALIZER") == "1":
+            if self.debug:
                 print(f"OpenAI 정규화 응답: {response}")
 
             result_text = response.choices[0].message.content.strip()
 
             try:
                 result = json.loads(result_text)
-                if isinstance(result, dict):
-                    return self._normalize_result_shape(result, user_message, matched_aliases)
             except json.JSONDecodeError:
-                pass
-
-            return self._normalize_result_shape({"output": result_text}, user_message, matched_aliases)
+                result = None
+            if not isinstance(result, dict):
+                result = {"output": result_text}
+
+            normalized = self._normalize_result_shape(result, user_message, matched_aliases)
+            # 예외로 인한 fallback 결과는 일시적 실패일 수 있으므로 캐시하지 않는다.
+            self.response_cache.set(cache_key, normalized)
+            return normalized
 
         except Exception as e:
             print(f"입력 정규화 중 오류: {e}")
@@ -2,12 +2,12 @@
 OpenAI 기반 ChatBot 구현
 """
 
-import openai
 import json
 import os
 from datetime import date
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from .vector_searcher import VectorSearcher
+from .openai_client import get_openai_client
 import time
 
 class OpenAIChatBot:
@@ -27,10 +27,12 @@ class OpenAIChatBot:
             model (str): 사용할 모델 (기본값: gpt-4.1)
             vector_searcher (Optional[VectorSearcher]): 기존 검색기 인스턴스(선택)
         """
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key=api_key)
         self.model = os.getenv("HIERARCHY_TOP_MODEL", model)
         # 서비스에서 생성한 인스턴스를 재사용해 중복 초기화를 방지한다.
         self.vector_searcher = vector_searcher or VectorSearcher()
+        # 최종 프롬프트 덤프 여부는 초기화 때 한 번만 읽어 매 요청마다 환경 변수를 조회하지 않는다.
+        self.debug_final_prompt = os.getenv("DEBUG_OPENAI_FINAL_PROMPT") == "1"
         
         # 시스템 프롬프트 설정
         self.system_prompt = """
@@ -76,63 +78,152 @@ class OpenAIChatBot:
             str: 생성된 응답
         """
         try:
-            messages = [{"role": "system", "content": self.system_prompt}]
-            retrieval_debug: Dict[str, Any] = {
-                "use_vector_search": use_vector_search,
-                "search_available": bool(getattr(self.vector_searcher, "search_available", False)),
-                "search_keywords": search_keywords or [],
-                "search_result_count": 0,
-                "sql_context_present": bool(sql_context),
-                "vector_context_provided": bool(vector_context),
-                "context_attached": False,
-            }
+            messages = self._build_response_messages(
+                user_query=user_query,
+                use_vector_search=use_vector_search,
+                start_date=start_date,
+                end_date=end_date,
+                search_keywords=search_keywords,
+                sql_context=sql_context,
+                vector_context=vector_context,
+                current_date_text=current_date_text,
+                call_site="generate_response",
+            )
+
+            # OpenAI API 호출
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+            )
             
-            # Vector DB에서 관련 정보 검색
-            generated_vector_context = ""
-            if vector_context:
-                generated_vector_context = vector_context
-            elif use_vector_search:
-                search_results = self.vector_searcher.search_with_keywords(
-                    user_query,
-                    keywords=search_keywords,
-                    top_k=30,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-                retrieval_debug["search_result_count"] = len(search_results)
-                
-                if search_results:
-                    # 관련 정보를 컨텍스트로 추가
-                    generated_vector_context = self.vector_searcher.format_search_results(search_results)
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            return f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"
 
-            filter_info = ""
-            if start_date or end_date:
-                filter_info = f"\n적용된 날짜 필터: {start_date} ~ {end_date}\n"
-            keyword_info = ""
-            if search_keywords:
-                keyword_info = f"\n적용된 검색 키워드: {', '.join(search_keywords)}\n"
+    def generate_response_stream(
+        self,
+        user_query: str,
+        use_vector_search: bool = True,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        search_keywords: Optional[List[str]] = None,
+        sql_context: Optional[str] = None,
+        vector_context: Optional[str] = None,
+        current_date_text: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        generate_response와 같은 프롬프트로 응답을 생성하되, 토큰이 도착하는 대로 조각을 내보낸다.
+        전체 답변이 끝날 때까지 기다리지 않으므로 첫 글자가 보이는 시간이 짧아진다.
+        
+        Yields:
+            str: 생성된 응답 조각
+        """
+        try:
+            messages = self._build_response_messages(
+                user_query=user_query,
+                use_vector_search=use_vector_search,
+                start_date=start_date,
+                end_date=end_date,
+                search_keywords=search_keywords,
+                sql_context=sql_context,
+                vector_context=vector_context,
+                current_date_text=current_date_text,
+                call_site="generate_response_stream",
+            )
 
-            context_sections: List[str] = []
-            if sql_context:
-                context_sections.append(
-                    "=== SQL 구조화 검색 결과 ===\n"
-                    f"{sql_context}"
-                )
-            if generated_vector_context:
-                context_sections.append(
-                    "=== 벡터 검색 결과 ===\n"
-                    f"{generated_vector_context}"
-                )
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                stream=True,
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
 
-            if context_sections:
-                context_body = "\n\n".join(context_sections)
-                date_rule = ""
-                if current_date_text:
-                    date_rule = (
-                        f"\n현재 기준 날짜(Asia/Seoul): {current_date_text}\n"
-                        "시간 표현(오늘/최근/지난달 등)은 반드시 위 날짜를 기준으로 해석하세요.\n"
-                    )
-                context_message = f"""
+        except Exception as e:
+            yield f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"
+
+    def _build_response_messages(
+        self,
+        user_query: str,
+        use_vector_search: bool,
+        start_date: date | None,
+        end_date: date | None,
+        search_keywords: Optional[List[str]],
+        sql_context: Optional[str],
+        vector_context: Optional[str],
+        current_date_text: Optional[str],
+        call_site: str,
+    ) -> List[Dict[str, str]]:
+        """
+        검색 컨텍스트를 붙여 최종 답변 생성용 메시지 목록 구성
+        
+        Returns:
+            List[Dict[str, str]]: OpenAI chat 메시지 목록
+        """
+        messages = [{"role": "system", "content": self.system_prompt}]
+        retrieval_debug: Dict[str, Any] = {
+            "use_vector_search": use_vector_search,
+            "search_available": bool(getattr(self.vector_searcher, "search_available", False)),
+            "search_keywords": search_keywords or [],
+            "search_result_count": 0,
+            "sql_context_present": bool(sql_context),
+            "vector_context_provided": bool(vector_context),
+            "context_attached": False,
+        }
+        
+        # Vector DB에서 관련 정보 검색
+        generated_vector_context = ""
+        if vector_context:
+            generated_vector_context = vector_context
+        elif use_vector_search:
+            search_results = self.vector_searcher.search_with_keywords(
+                user_query,
+                keywords=search_keywords,
+                top_k=30,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            retrieval_debug["search_result_count"] = len(search_results)
+            
+            if search_results:
+                # 관련 정보를 컨텍스트로 추가
+                generated_vector_context = self.vector_searcher.format_search_results(search_results)
+
+        filter_info = ""
+        if start_date or end_date:
+            filter_info = f"\n적용된 날짜 필터: {start_date} ~ {end_date}\n"
+        keyword_info = ""
+        if search_keywords:
+            keyword_info = f"\n적용된 검색 키워드: {', '.join(search_keywords)}\n"
+
+        context_sections: List[str] = []
+        if sql_context:
+            context_sections.append(
+                "=== SQL 구조화 검색 결과 ===\n"
+                f"{sql_context}"
+            )
+        if generated_vector_context:
+            context_sections.append(
+                "=== 벡터 검색 결과 ===\n"
+                f"{generated_vector_context}"
+            )
+
+        if context_sections:
+            context_body = "\n\n".join(context_sections)
+            date_rule = ""
+            if current_date_text:
+                date_rule = (
+                    f"\n현재 기준 날짜(Asia/Seoul): {current_date_text}\n"
+                    "시간 표현(오늘/최근/지난달 등)은 반드시 위 날짜를 기준으로 해석하세요.\n"
+                )
+            context_message = f"""
 다음은 사용자 질문과 관련된 KAIST 전산학부 정보입니다. 반드시 모든 정보를 함께 참고하여 답변해주세요.
 
 {context_body}
@@ -152,34 +243,23 @@ class OpenAIChatBot:
 정보에 링크가 포함되어 있다면 반드시 함께 제공해주세요.
 질문이 정보 탐색형이면 핵심 요약 뒤에 세부 항목을 충분히 자세히 설명해주세요.
 """
-                messages.append({"role": "user", "content": context_message})
-                retrieval_debug["context_attached"] = True
-                retrieval_debug["vector_context_attached"] = bool(generated_vector_context)
-                retrieval_debug["sql_context_attached"] = bool(sql_context)
-            else:
-                messages.append({"role": "user", "content": user_query})
-            
-            # OpenAI API 호출 직전 최종 프롬프트/요청 payload 디버그 로그
-            self._log_final_request(
-                messages=messages,
-                temperature=0.7,
-                max_tokens=None,
-                call_site="generate_response",
-                retrieval_debug=retrieval_debug,
-            )
+            messages.append({"role": "user", "content": context_message})
+            retrieval_debug["context_attached"] = True
+            retrieval_debug["vector_context_attached"] = bool(generated_vector_context)
+            retrieval_debug["sql_context_attached"] = bool(sql_context)
+        else:
+            messages.append({"role": "user", "content": user_query})
+        
+        # OpenAI API 호출 직전 최종 프롬프트/요청 payload 디버그 로그
+        self._log_final_request(
+            messages=messages,
+            temperature=0.7,
+            max_tokens=None,
+            call_site=call_site,
+            retrieval_debug=retrieval_debug,
+        )
+        return messages
 
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            return f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"
-    
     def generate_response_with_context(self, user_query: str, additional_context: str = "") -> str:
         """
         추가 컨텍스트와 함께 응답 생성
@@ -264,7 +344,7 @@ class OpenAIChatBot:
         OpenAI API로 보내기 직전의 최종 요청 payload를 디버그 로그로 출력한다.
         DEBUG_OPENAI_FINAL_PROMPT=1 일 때만 출력한다.
         """
-        if os.getenv("DEBUG_OPENAI_FINAL_PROMPT") != "1":
+        if not self.debug_final_prompt:
             return
 
         payload = {
@@ -0,0 +1,53 @@
+"""
+공유 OpenAI 클라이언트
+
+체커/정규화기/날짜 필터/계층 검색/답변 생성기가 각자 OpenAI()를 만들면
+클래스마다 별도 HTTP 커넥션 풀이 생겨 같은 api.openai.com 연결을 따로 맺는다.
+API 키별로 클라이언트 하나를 만들어 프로세스 전체에서 재사용한다.
+"""
+
+import os
+from functools import lru_cache
+
+import httpx
+import openai
+
+
+# httpx 기본 keep-alive 만료(5초)는 사용자 질문 사이 간격보다 짧아
+# 매 질문마다 TLS 핸드셰이크를 다시 하게 되므로 유휴 연결을 더 오래 유지한다.
+OPENAI_HTTP_KEEPALIVE_SEC = float(os.getenv("OPENAI_HTTP_KEEPALIVE_SEC", "120"))
+# 연결 수 상한은 SDK 기본값과 같게 두고, 계층 검색 워커 수 등을 늘릴 때 환경 변수로 조정한다.
+OPENAI_HTTP_MAX_CONNECTIONS = int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "1000"))
+OPENAI_HTTP_MAX_KEEPALIVE = int(os.getenv("OPENAI_HTTP_MAX_KEEPALIVE", "100"))
+# SDK 기본값(읽기 600초)은 멈춘 요청이 워커를 너무 오래 붙잡으므로 짧게 두고, 연결 수립은 빨리 포기한다.
+OPENAI_TIMEOUT_SEC = float(os.getenv("OPENAI_TIMEOUT_SEC", "120"))
+OPENAI_CONNECT_TIMEOUT_SEC = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SEC", "5"))
+# SDK는 429/5xx/연결 오류를 지수 백오프 + 지터로 재시도한다. 기본 2회를 환경 변수로 조정할 수 있게 한다.
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """
+    API 키에 해당하는 공유 OpenAI 클라이언트 반환
+
+    Args:
+        api_key (str): OpenAI API 키
+
+    Returns:
+        openai.OpenAI: 스레드 간에 공유 가능한 클라이언트
+    """
+    http_client = openai.DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=OPENAI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=OPENAI_HTTP_KEEPALIVE_SEC,
+        ),
+    )
+    # 요청 타임아웃은 SDK가 요청마다 client.timeout으로 덮어쓰므로 클라이언트 쪽에 지정한다.
+    return openai.OpenAI(
+        api_key=api_key,
+        http_client=http_client,
+        timeout=httpx.Timeout(OPENAI_TIMEOUT_SEC, connect=OPENAI_CONNECT_TIMEOUT_SEC),
+        max_retries=max(0, OPENAI_MAX_RETRIES),
+    )
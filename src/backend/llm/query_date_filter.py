@@ -5,10 +5,11 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Optional
 
-import openai
+from .openai_client import get_openai_client
+from .response_cache import LLMResponseCache, normalize_cache_text
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryDateFilter:
     start_date: Optional[date] = None
     end_date: Optional[date] = None
@@ -128,15 +129,22 @@ def _parse_explicit_dates(text: str) -> list[date]:
 class QueryDateFilterExtractor:
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
         self.model = model
-        self.client = openai.OpenAI(api_key=api_key) if api_key else None
+        self.client = get_openai_client(api_key=api_key) if api_key else None
         self.debug = os.getenv("DEBUG_DATE_FILTER") == "1"
+        # 상대 표현(최근/지난달)은 기준 날짜에 따라 달라지므로 오늘 날짜까지 키에 넣어 캐시한다.
+        self.response_cache = LLMResponseCache()
 
     def _extract_with_llm(self, query: str, base: date) -> Optional[QueryDateFilter]:
         if self.client is None:
             return None
 
+        today_text = base.isoformat()
+        cache_key = (self.model, today_text, normalize_cache_text(query))
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            today_text = base.isoformat()
             messages = [
                 {"role": "system", "content": DATE_FILTER_SYSTEM_PROMPT},
                 {
@@ -153,6 +161,7 @@ class QueryDateFilterExtractor:
                 model=self.model,
                 messages=messages,
                 temperature=0.0,
+                response_format={"type": "json_object"},
             )
             raw = (response.choices[0].message.content or "").strip()
             payload = _extract_json_object(raw)
@@ -176,6 +185,7 @@ class QueryDateFilterExtractor:
                         "end_date": str(extracted.end_date) if extracted.end_date else None,
                     },
                 )
+            self.response_cache.set(cache_key, extracted)
             return extracted
         except Exception as e:
             if self.debug:
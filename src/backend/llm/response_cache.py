@@ -0,0 +1,186 @@
+"""
+LLM 응답 캐시
+
+같은 입력(부팅 워밍업, 반복 질문)에 대해 동일한 분류/정규화 호출을 다시 보내지 않도록
+성공한 응답만 TTL + LRU 방식으로 프로세스 메모리에 보관한다.
+벡터 검색 결과는 질의 임베딩 유사도로 찾는 SemanticSearchCache에 보관한다.
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def normalize_cache_text(text: str) -> str:
+    """공백/줄바꿈 차이만 있는 같은 질문이 한 캐시 항목을 쓰도록 키용 텍스트를 정리한다."""
+    return " ".join((text or "").split())
+
+
+class LLMResponseCache:
+    """스레드 안전한 TTL + LRU 응답 캐시"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_sec: Optional[float] = None):
+        """
+        Args:
+            max_entries (Optional[int]): 최대 보관 개수 (기본값: LLM_RESPONSE_CACHE_SIZE 또는 256)
+            ttl_sec (Optional[float]): 보관 시간(초), 0 이하면 캐시 비활성 (기본값: LLM_RESPONSE_CACHE_TTL_SEC 또는 600)
+        """
+        if max_entries is None:
+            max_entries = int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "256"))
+        if ttl_sec is None:
+            ttl_sec = float(os.getenv("LLM_RESPONSE_CACHE_TTL_SEC", "600"))
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_sec = max(0.0, float(ttl_sec))
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_sec > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl_sec:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+        # 호출자가 결과를 수정해도 캐시 원본이 바뀌지 않도록 복사본을 돌려준다.
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticSearchCache:
+    """
+    질의 임베딩의 코사인 유사도로 조회하는 검색 결과 캐시
+
+    표현만 조금 다른 같은 질문(띄어쓰기, 어미, 조사 차이 등)이 들어오면 저장된 검색 결과를 돌려주어
+    컬렉션별 DB 검색을 다시 하지 않는다. 날짜 필터처럼 결과를 바꾸는 조건은 scope로 따로 구분한다.
+    연도/교수명/과목 코드만 다른 짧은 질의도 임베딩 유사도가 매우 높게 나와 다른 질의의 결과를
+    돌려줄 수 있으므로, 임계값을 명시적으로 지정했을 때만 동작한다.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        ttl_sec: Optional[float] = None,
+    ):
+        """
+        Args:
+            threshold (Optional[float]): 적중으로 볼 최소 코사인 유사도 (기본값: VECTOR_SEMANTIC_CACHE_THRESHOLD, 없으면 캐시 비활성)
+            max_entries (Optional[int]): 최대 보관 개수, 0이면 캐시 비활성 (기본값: VECTOR_SEMANTIC_CACHE_SIZE 또는 1024)
+            ttl_sec (Optional[float]): 보관 시간(초), 0 이하면 캐시 비활성 (기본값: VECTOR_SEMANTIC_CACHE_TTL_SEC 또는 600)
+        """
+        if threshold is None:
+            threshold_text = os.getenv("VECTOR_SEMANTIC_CACHE_THRESHOLD", "").strip()
+            threshold = float(threshold_text) if threshold_text else None
+        if max_entries is None:
+            max_entries = int(os.getenv("VECTOR_SEMANTIC_CACHE_SIZE", "1024"))
+        if ttl_sec is None:
+            ttl_sec = float(os.getenv("VECTOR_SEMANTIC_CACHE_TTL_SEC", "600"))
+        self.threshold = float(threshold) if threshold is not None else None
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_sec = max(0.0, float(ttl_sec))
+        self._entries: "OrderedDict[int, Tuple[float, Hashable, np.ndarray, Any]]" = OrderedDict()
+        # (scope, 차원)별 (entry id 목록, 단위 벡터 행렬). 항목이 바뀔 때만 다시 만든다.
+        # 임베딩 모델이 바뀌어 차원이 달라져도 서로 다른 차원의 벡터를 한 행렬에 섞지 않는다.
+        self._matrices: Dict[Tuple[Hashable, int], Tuple[List[int], np.ndarray]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold is not None and self.max_entries > 0 and self.ttl_sec > 0
+
+    @staticmethod
+    def _unit_vector(vector: Sequence[float]) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(array))
+        if array.size == 0 or norm <= 0.0:
+            return None
+        return array / norm
+
+    def _scope_matrix(self, scope: Hashable, dim: int) -> Optional[Tuple[List[int], np.ndarray]]:
+        cached = self._matrices.get((scope, dim))
+        if cached is None:
+            ids = [
+                entry_id
+                for entry_id, (_, entry_scope, vector, _) in self._entries.items()
+                if entry_scope == scope and vector.shape[0] == dim
+            ]
+            if not ids:
+                return None
+            cached = (ids, np.stack([self._entries[entry_id][2] for entry_id in ids]))
+            self._matrices[(scope, dim)] = cached
+        return cached
+
+    def get(self, scope: Hashable, vector: Sequence[float]) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        query = self._unit_vector(vector)
+        if query is None:
+            return None
+        with self._lock:
+            scope_matrix = self._scope_matrix(scope, query.shape[0])
+            if scope_matrix is None:
+                return None
+            ids, matrix = scope_matrix
+            # 저장된 벡터가 모두 단위 벡터이므로 행렬-벡터 곱 한 번이 곧 코사인 유사도다.
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            if float(similarities[best]) < self.threshold:
+                return None
+            entry_id = ids[best]
+            stored_at, _, _, value = self._entries[entry_id]
+            if time.monotonic() - stored_at >= self.ttl_sec:
+                self._entries.pop(entry_id, None)
+                self._matrices.pop((scope, query.shape[0]), None)
+                return None
+            self._entries.move_to_end(entry_id)
+        # 호출자가 결과를 수정해도 캐시 원본이 바뀌지 않도록 복사본을 돌려준다.
+        return copy.deepcopy(value)
+
+    def set(self, scope: Hashable, vector: Sequence[float], value: Any) -> None:
+        if not self.enabled:
+            return
+        unit = self._unit_vector(vector)
+        if unit is None:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (time.monotonic(), scope, unit, stored)
+            self._matrices.pop((scope, unit.shape[0]), None)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted_scope, evicted_vector, _) = self._entries.popitem(last=False)
+                self._matrices.pop((evicted_scope, evicted_vector.shape[0]), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
@@ -15,10 +15,11 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-import openai
 import psycopg
 from psycopg.conninfo import conninfo_to_dict, make_conninfo
 
+from .openai_client import get_openai_client
+
 
 SOC_SCHEMA_PROMPT = """
 [DB 개요]
@@ -172,7 +173,7 @@ BLOCKED_SQL_PATTERN = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SQLContextResult:
     sql: Optional[str] = None
     reason: Optional[str] = None
@@ -199,7 +200,7 @@ class SQLContextRetriever:
         soc_db_dsn: Optional[str] = None,
         max_rows: int = 100,
     ):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key=api_key)
         self.model = model
         self.summary_model = summary_model
         self.keyword_model = keyword_model
@@ -354,6 +355,7 @@ class SQLContextRetriever:
                 messages=messages,
                 temperature=0.0,
                 max_tokens=280,
+                response_format={"type": "json_object"},
             )
             raw = (response.choices[0].message.content or "").strip()
             payload = self._extract_json_object(raw)
@@ -465,6 +467,7 @@ class SQLContextRetriever:
                 messages=messages,
                 temperature=0.1,
                 max_tokens=420,
+                response_format={"type": "json_object"},
             )
             raw = (response.choices[0].message.content or "").strip()
             payload = self._extract_json_object(raw) or {}
@@ -607,6 +610,7 @@ class SQLContextRetriever:
                 messages=messages,
                 temperature=0.1,
                 max_tokens=180,
+                response_format={"type": "json_object"},
             )
             raw = (response.choices[0].message.content or "").strip()
             parsed = self._extract_json_object(raw) or {}
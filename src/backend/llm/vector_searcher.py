@@ -2,21 +2,40 @@
 PostgreSQL + pgvector 검색 모듈
 """
 
+import heapq
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import List, Dict, Any, Optional, Tuple
 
+from .response_cache import SemanticSearchCache
 from ..vector_db.config import FORMATS, PGVECTOR_TABLE
+from ..vector_db.embedding import embed_query
 from ..vector_db.vector_db_helper import (
     get_pgvector_client,
     ensure_schema,
     search_doc,
     search_doc_by_entities,
-    fetch_full_doc_by_source,
+    fetch_full_docs_by_sources,
     fetch_full_doc_by_chunk_id,
 )
 
+# format_search_results에서 출력하는 메타데이터 항목과 표시 이름(출력 순서대로)
+SEARCH_RESULT_METADATA_LABELS: Tuple[Tuple[str, str], ...] = (
+    ("title", "제목"),
+    ("author", "작성자"),
+    ("name", "이름"),
+    ("position", "직책"),
+    ("field", "분야"),
+    ("date", "날짜"),
+    ("start_date", "시작일"),
+    ("end_date", "종료일"),
+    ("link", "링크"),
+)
+
 
 class VectorSearcher:
     """pgvector에서 유사한 정보를 검색하는 클래스"""
@@ -28,6 +47,26 @@ class VectorSearcher:
             1,
             int(os.getenv("HIERARCHY_ENTITY_SEARCH_KEYWORD_LIMIT", "3")),
         )
+        # 키워드별 검색은 서로 독립적이므로 병렬로 실행한다(1이면 순차 실행).
+        self.keyword_search_max_workers = max(
+            1,
+            int(os.getenv("VECTOR_SEARCH_KEYWORD_WORKERS", "4")),
+        )
+        # 컬렉션별 검색도 독립적이므로 병렬로 실행한다(1이면 순차 실행).
+        self.collection_search_max_workers = max(
+            1,
+            int(os.getenv("VECTOR_SEARCH_COLLECTION_WORKERS", "6")),
+        )
+        # collection 목록은 거의 바뀌지 않으므로 짧은 TTL 동안 메모리에서 재사용한다(0이면 비활성).
+        self.collections_cache_ttl_sec = max(
+            0.0,
+            float(os.getenv("VECTOR_COLLECTIONS_CACHE_TTL_SEC", "60")),
+        )
+        self._collections_cache: Optional[Tuple[float, List[str]]] = None
+        self._collections_cache_lock = threading.Lock()
+        # 표현만 다른 반복 질문은 질의 임베딩 유사도로 이전 검색 결과를 재사용한다.
+        # (VECTOR_SEMANTIC_CACHE_THRESHOLD를 지정한 경우에만 동작)
+        self.semantic_cache = SemanticSearchCache()
 
         try:
             self.client = get_pgvector_client()
@@ -58,8 +97,25 @@ class VectorSearcher:
             if not collections:
                 return []
             per_collection_k = max(1, top_k // max(1, len(collections)) + 5)
+            # 컬렉션별 검색이 같은 질의 임베딩을 쓰므로, 병렬 실행 전에 한 번 계산해 각 검색에 넘긴다.
+            # (동시에 캐시 미스가 나면 스레드마다 임베딩 API를 따로 호출하게 된다.)
+            query_vector = embed_query(query)
+            if not query_vector:
+                return []
+            # 날짜 필터/제외 문서/컬렉션 구성이 같을 때만 유사 질의의 결과를 재사용한다.
+            cache_scope = (
+                top_k,
+                start_date,
+                end_date,
+                tuple(sorted(excluded_ids)),
+                tuple(collections),
+            )
+            cached_results = self.semantic_cache.get(cache_scope, query_vector)
+            if cached_results is not None:
+                return cached_results
 
-            for collection in collections:
+            def search_collection(collection: str) -> List[Dict[str, Any]]:
+                collection_results: List[Dict[str, Any]] = []
                 try:
                     results = search_doc(
                         self.client,
@@ -68,57 +124,33 @@ class VectorSearcher:
                         per_collection_k,
                         start_date=start_date,
                         end_date=end_date,
+                        query_vector=query_vector,
                     )
                     for result in results:
-                        payload = result.payload or {}
-                        source_id = payload.get("source_id")
-                        chunk_db_id = payload.get("chunk_db_id") or result.id
-                        doc_id = self._normalize_doc_id(
-                            collection=collection,
-                            source_id=source_id,
-                            chunk_db_id=chunk_db_id,
-                            doc_id=payload.get("doc_id"),
-                        )
-                        if doc_id in excluded_ids:
+                        item = self._convert_search_hit_to_result(result, fallback_collection=collection)
+                        if item["doc_id"] in excluded_ids:
                             continue
-
-                        if payload.get("content"):
-                            payload_content = payload.get("content", "")
-                        elif payload.get("contents"):
-                            payload_content = payload.get("contents", "")
-                        elif payload.get("etc"):
-                            payload_content = payload.get("etc", "")
-                        else:
-                            payload_content = ""
-
-                        all_results.append(
-                            {
-                                "doc_id": doc_id,
-                                "source_id": source_id,
-                                "chunk_db_id": chunk_db_id,
-                                "content": payload_content,
-                                "score": result.score,
-                                "collection": collection,
-                                "metadata": {
-                                    "title": payload.get("title", ""),
-                                    "date": payload.get("date", ""),
-                                    "start_date": payload.get("start_date", ""),
-                                    "end_date": payload.get("end_date", ""),
-                                    "link": payload.get("link", "") or payload.get("url", ""),
-                                    "author": payload.get("author", ""),
-                                    "name": payload.get("name", ""),
-                                    "position": payload.get("position", ""),
-                                    "field": payload.get("field", ""),
-                                    "id": payload.get("id", ""),
-                                },
-                            }
-                        )
+                        collection_results.append(item)
                 except Exception as e:
                     print(f"컬렉션 {collection} 검색 중 오류: {e}")
-                    continue
-
-            all_results.sort(key=lambda x: x["score"], reverse=True)
-            return all_results[:top_k]
+                return collection_results
+
+            # 컬렉션 검색은 서로 독립적인 DB 왕복이므로 동시에 실행한다.
+            # executor.map은 입력 순서를 유지하므로 결과 순서는 순차 실행과 동일하다.
+            max_workers = min(self.collection_search_max_workers, len(collections))
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    per_collection_results = list(executor.map(search_collection, collections))
+            else:
+                per_collection_results = [search_collection(collection) for collection in collections]
+            for collection_results in per_collection_results:
+                all_results.extend(collection_results)
+
+            # 전체 정렬 없이 상위 top_k개만 고른다(sorted(...)[:top_k]와 같은 순서).
+            top_results = heapq.nlargest(top_k, all_results, key=lambda x: x["score"])
+            if top_results:
+                self.semantic_cache.set(cache_scope, query_vector, top_results)
+            return top_results
         except Exception as e:
             print(f"검색 중 오류 발생: {e}")
             return []
@@ -134,6 +166,12 @@ class VectorSearcher:
         if not self.search_available or not self.client:
             return list(FORMATS.keys())
 
+        if self.collections_cache_ttl_sec > 0:
+            with self._collections_cache_lock:
+                cached = self._collections_cache
+            if cached is not None and time.monotonic() - cached[0] < self.collections_cache_ttl_sec:
+                return list(cached[1])
+
         table = self._safe_table_ident(PGVECTOR_TABLE)
         try:
             with self.client.connect() as conn:
@@ -142,6 +180,9 @@ class VectorSearcher:
                     rows = cur.fetchall()
             collections = [str(row[0]).strip() for row in rows if row and str(row[0]).strip()]
             if collections:
+                if self.collections_cache_ttl_sec > 0:
+                    with self._collections_cache_lock:
+                        self._collections_cache = (time.monotonic(), list(collections))
                 return collections
         except Exception as e:
             print(f"⚠️ collection 목록 조회 실패, FORMATS fallback 사용: {e}")
@@ -163,14 +204,7 @@ class VectorSearcher:
             doc_id=payload.get("doc_id"),
         )
 
-        if payload.get("content"):
-            payload_content = payload.get("content", "")
-        elif payload.get("contents"):
-            payload_content = payload.get("contents", "")
-        elif payload.get("etc"):
-            payload_content = payload.get("etc", "")
-        else:
-            payload_content = ""
+        payload_content = payload.get("content") or payload.get("contents") or payload.get("etc") or ""
 
         return {
             "doc_id": doc_id,
@@ -233,12 +267,14 @@ class VectorSearcher:
         if not doc_ids:
             return []
         out: List[str] = []
+        seen: set[str] = set()
         for item in doc_ids:
             if not isinstance(item, str):
                 continue
             cleaned = item.strip()
-            if not cleaned or cleaned in out:
+            if not cleaned or cleaned in seen:
                 continue
+            seen.add(cleaned)
             out.append(cleaned)
         return out
 
@@ -325,14 +361,25 @@ class VectorSearcher:
         merged: Dict[str, Dict[str, Any]] = {}
         per_query_k = max(5, top_k // len(search_queries) + 3)
 
-        for search_query in search_queries:
-            query_results = self.search_similar_documents(
+        def run_query(search_query: str) -> List[Dict[str, Any]]:
+            return self.search_similar_documents(
                 search_query,
                 top_k=per_query_k,
                 start_date=start_date,
                 end_date=end_date,
                 exclude_doc_ids=excluded_doc_ids,
             )
+
+        # 키워드 검색을 동시에 실행해 전체 대기 시간을 가장 느린 검색 1건 수준으로 줄인다.
+        # executor.map은 입력 순서를 유지하므로 병합 결과는 순차 실행과 동일하다.
+        max_workers = min(self.keyword_search_max_workers, len(search_queries))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                per_query_results = list(executor.map(run_query, search_queries))
+        else:
+            per_query_results = [run_query(search_query) for search_query in search_queries]
+
+        for search_query, query_results in zip(search_queries, per_query_results):
             if debug_vector_search:
                 print(f"🔎 query='{search_query}' result count: {len(query_results)}")
             for result in query_results:
@@ -343,11 +390,10 @@ class VectorSearcher:
                 if prev is None or float(merged_result["score"]) > float(prev["score"]):
                     merged[result_id] = merged_result
 
-        final_results = sorted(merged.values(), key=lambda x: x["score"], reverse=True)
-        if final_results:
+        if merged:
             if debug_vector_search:
-                print(f"🔎 merged result count: {len(final_results)}")
-            return final_results[:top_k]
+                print(f"🔎 merged result count: {len(merged)}")
+            return heapq.nlargest(top_k, merged.values(), key=lambda x: x["score"])
 
         # 키워드별 검색이 모두 0건이면, 키워드를 한 문장으로 합쳐 한 번 더 시도한다.
         # (전체 정규화 질문이 아닌 키워드만 사용)
@@ -425,35 +471,56 @@ class VectorSearcher:
                 if prev is None or float(item.get("score", 0.0)) > float(prev.get("score", 0.0)):
                     merged[identity] = item
 
-        results = sorted(merged.values(), key=lambda x: float(x.get("score", 0.0)), reverse=True)
-        return results[:top_k]
+        return heapq.nlargest(top_k, merged.values(), key=lambda x: float(x.get("score", 0.0)))
 
     def fetch_full_documents_by_doc_ids(
         self,
         doc_ids: Optional[List[str]],
         max_docs: int = 20,
+        max_chars_per_doc: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         if not self.search_available or not self.client:
             return []
 
         sanitized = self._sanitize_doc_ids(doc_ids)[: max(1, max_docs)]
+        parsed_doc_ids = [(doc_id, self._parse_doc_id(doc_id)) for doc_id in sanitized]
+
+        # source_id 기반 문서는 한 번의 쿼리로 모아서 조회한다(문서별 커넥션 왕복 제거).
+        source_docs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        source_keys = [
+            (collection, source_id)
+            for _, (collection, source_id, _) in parsed_doc_ids
+            if collection and source_id
+        ]
+        if source_keys:
+            try:
+                source_docs = fetch_full_docs_by_sources(
+                    self.client,
+                    source_keys,
+                    max_chars=max_chars_per_doc,
+                )
+            except Exception as e:
+                print(f"⚠️ full_content 일괄 조회 실패: {e}")
+
         documents: List[Dict[str, Any]] = []
         seen: set[str] = set()
-
-        for doc_id in sanitized:
-            collection, source_id, chunk_id = self._parse_doc_id(doc_id)
+        for doc_id, (collection, source_id, chunk_id) in parsed_doc_ids:
             if not collection:
                 continue
 
             doc: Optional[Dict[str, Any]] = None
-            try:
-                if source_id:
-                    doc = fetch_full_doc_by_source(self.client, collection, source_id)
-                elif chunk_id is not None:
-                    doc = fetch_full_doc_by_chunk_id(self.client, chunk_id)
-            except Exception as e:
-                print(f"⚠️ full_content 조회 실패({doc_id}): {e}")
-                continue
+            if source_id:
+                doc = source_docs.get((collection, source_id))
+            elif chunk_id is not None:
+                try:
+                    doc = fetch_full_doc_by_chunk_id(
+                        self.client,
+                        chunk_id,
+                        max_chars=max_chars_per_doc,
+                    )
+                except Exception as e:
+                    print(f"⚠️ full_content 조회 실패({doc_id}): {e}")
+                    continue
 
             if not doc:
                 continue
@@ -528,37 +595,24 @@ class VectorSearcher:
         if not results:
             return "관련 정보를 찾을 수 없습니다."
 
-        formatted_text = "=== 관련 정보 ===\n\n"
+        # 문자열을 += 로 이어 붙이면 결과마다 전체 문자열이 다시 복사되므로 조각을 모아 한 번에 합친다.
+        parts: List[str] = ["=== 관련 정보 ===\n\n"]
         for i, result in enumerate(results, 1):
-            formatted_text += f"[정보 {i}]\n"
+            parts.append(f"[정보 {i}]\n")
             metadata = result["metadata"]
 
-            if metadata.get("title"):
-                formatted_text += f"제목: {metadata['title']}\n"
-            if metadata.get("author"):
-                formatted_text += f"작성자: {metadata['author']}\n"
-            if metadata.get("name"):
-                formatted_text += f"이름: {metadata['name']}\n"
-            if metadata.get("position"):
-                formatted_text += f"직책: {metadata['position']}\n"
-            if metadata.get("field"):
-                formatted_text += f"분야: {metadata['field']}\n"
-            if metadata.get("date"):
-                formatted_text += f"날짜: {metadata['date']}\n"
-            if metadata.get("start_date"):
-                formatted_text += f"시작일: {metadata['start_date']}\n"
-            if metadata.get("end_date"):
-                formatted_text += f"종료일: {metadata['end_date']}\n"
-            if metadata.get("link"):
-                formatted_text += f"링크: {metadata['link']}\n"
+            for key, label in SEARCH_RESULT_METADATA_LABELS:
+                value = metadata.get(key)
+                if value:
+                    parts.append(f"{label}: {value}\n")
 
             content = result["content"]
             if len(content) > 300:
                 content = content[:300] + "..."
 
-            formatted_text += f"내용: {content}\n"
-            formatted_text += f"유사도 점수: {result['score']:.4f}\n"
-            formatted_text += f"출처: {result['collection']}\n"
-            formatted_text += "-" * 50 + "\n\n"
+            parts.append(f"내용: {content}\n")
+            parts.append(f"유사도 점수: {result['score']:.4f}\n")
+            parts.append(f"출처: {result['collection']}\n")
+            parts.append("-" * 50 + "\n\n")
 
-        return formatted_text
+        return "".join(parts)
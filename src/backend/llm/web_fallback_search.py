@@ -4,17 +4,23 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 from urllib.parse import parse_qs, unquote, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class WebFallbackSearcher:
     SEARCH_URL = "https://duckduckgo.com/html/"
     BING_RSS_URL = "https://www.bing.com/search"
+    CACHE_MAX_ENTRIES = 256
 
     def __init__(
         self,
@@ -22,15 +28,41 @@ class WebFallbackSearcher:
         timeout_sec: int = 8,
         region: str = "kr-kr",
         debug: bool = False,
+        cache_ttl_sec: int = 300,
     ):
         self.timeout_sec = max(2, int(timeout_sec))
         self.region = (region or "kr-kr").strip() or "kr-kr"
         self.debug = debug
+        # 같은 질의에 대한 외부 검색은 결과가 거의 바뀌지 않으므로 TTL 동안 재사용한다(0이면 비활성).
+        self.cache_ttl_sec = max(0, int(cache_ttl_sec))
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.user_agent = (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/124.0.0.0 Safari/537.36"
         )
+        # 검색마다 TCP/TLS 핸드셰이크를 반복하지 않도록 keep-alive 세션을 재사용한다.
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        # 일시적인 5xx/연결 오류는 짧은 backoff로 재시도해 timeout까지 기다리지 않게 한다.
+        # 읽기 timeout은 재시도하면 엔진마다 최악 대기 시간이 두 배가 되므로 재시도하지 않는다.
+        retry = Retry(
+            total=2,
+            connect=2,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": self.user_agent})
+        return session
 
     @staticmethod
     def _normalize_url(raw_href: str) -> str:
@@ -55,10 +87,9 @@ class WebFallbackSearcher:
 
     def _search_bing_rss(self, query: str, max_results: int) -> List[Dict[str, str]]:
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.BING_RSS_URL,
                 params={"q": query, "format": "rss"},
-                headers={"User-Agent": self.user_agent},
                 timeout=self.timeout_sec,
             )
             response.raise_for_status()
@@ -89,12 +120,46 @@ class WebFallbackSearcher:
                 break
         return results
 
+    def _get_cached(self, key: Tuple[str, int]) -> List[Dict[str, str]] | None:
+        if self.cache_ttl_sec <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at >= self.cache_ttl_sec:
+                self._cache.pop(key, None)
+                return None
+            self._cache.move_to_end(key)
+            return [dict(item) for item in results]
+
+    def _set_cached(self, key: Tuple[str, int], results: List[Dict[str, str]]) -> None:
+        # 빈 결과는 일시적 실패일 수 있으므로 캐시하지 않는다.
+        if self.cache_ttl_sec <= 0 or not results:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), [dict(item) for item in results])
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
     def search(self, query: str, max_results: int = 5) -> List[Dict[str, str]]:
         cleaned_query = self._clean_text(query)
         if not cleaned_query:
             return []
 
         safe_max = max(1, min(int(max_results), 10))
+        cache_key = (cleaned_query, safe_max)
+        cached_results = self._get_cached(cache_key)
+        if cached_results is not None:
+            return cached_results
+
+        results = self._search_uncached(cleaned_query, safe_max)
+        self._set_cached(cache_key, results)
+        return results
+
+    def _search_uncached(self, cleaned_query: str, safe_max: int) -> List[Dict[str, str]]:
         # 1) Bing RSS(무키) 우선 시도
         bing_results = self._search_bing_rss(cleaned_query, safe_max)
         if bing_results:
@@ -102,10 +167,9 @@ class WebFallbackSearcher:
 
         # 2) 실패 시 DuckDuckGo HTML fallback
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.SEARCH_URL,
                 params={"q": cleaned_query, "kl": self.region},
-                headers={"User-Agent": self.user_agent},
                 timeout=self.timeout_sec,
             )
             response.raise_for_status()
@@ -1,10 +1,39 @@
 """
 Server 패키지 초기화
+
+FastAPI 앱과 ChatBot 서비스는 속성에 처음 접근할 때 불러온다(PEP 562).
 """
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_ATTRS = {
+    "app": ".server",
+    "ChatRequest": ".models",
+    "ChatResponse": ".models",
+    "HealthResponse": ".models",
+    "ErrorResponse": ".models",
+    "ChatBotService": ".chatbot_service",
+    "get_chatbot_service": ".chatbot_service",
+}
+
+if TYPE_CHECKING:
+    from .server import app
+    from .models import ChatRequest, ChatResponse, HealthResponse, ErrorResponse
+    from .chatbot_service import ChatBotService, get_chatbot_service
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .server import app
-from .models import ChatRequest, ChatResponse, HealthResponse, ErrorResponse
-from .chatbot_service import ChatBotService, get_chatbot_service
 
 __all__ = [
     "app",
@@ -5,12 +5,16 @@ ChatBot 서비스 클래스
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
@@ -30,6 +34,25 @@ from ..llm.hierarchical_node_search import (
 from ..llm.query_date_filter import QueryDateFilterExtractor
 
 
+# 요청마다 다시 만들지 않도록 키워드 필터 상수는 모듈 로드 시 한 번만 구성한다.
+SOC_QUERY_KEYWORDS: tuple[str, ...] = (
+    "전산학부",
+    "soc",
+    "kaist",
+    "학생회",
+    "집행위",
+    "학사",
+    "교수",
+    "수강",
+    "행사",
+    "공지",
+)
+KEYWORD_STOPWORDS = frozenset({"최근", "요즘", "이번", "최신", "정보", "질문", "알려줘", "알려주세요", "문의"})
+KST = ZoneInfo("Asia/Seoul")
+SOC_QUERY_PATTERN = re.compile("|".join(re.escape(k) for k in SOC_QUERY_KEYWORDS))
+LITERAL_KEYWORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9._/-]{1,}|[가-힣]{2,}")
+
+
 class ChatBotService:
     """
     ChatBot 서비스 클래스
@@ -64,6 +87,13 @@ class ChatBotService:
         self.hierarchy_trace_console_enabled = False
         self.hierarchy_trace_log_path = self.project_root / "logs" / "hierarchy_search_trace.log"
         self.hierarchy_trace_console_max_lines = 40
+        # /ontology 응답은 entity.json 전체를 읽어 만들므로 짧은 TTL 동안 재사용한다.
+        self.ontology_cache_ttl_sec = 30.0
+        self._ontology_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        self._ontology_cache_lock = threading.Lock()
+        # 정규화/유효성 검사/날짜 필터 LLM 호출을 동시에 보내기 위한 풀
+        self.preprocess_max_workers = 6
+        self._preprocess_executor: Optional[ThreadPoolExecutor] = None
 
         self.debug_hierarchy_search = (
             os.getenv("DEBUG_HIERARCHY_SEARCH") == "1"
@@ -121,6 +151,15 @@ class ChatBotService:
             if not trace_log_path.is_absolute():
                 trace_log_path = (self.project_root / trace_log_path).resolve()
             self.hierarchy_trace_log_path = trace_log_path
+            self.ontology_cache_ttl_sec = max(
+                0.0,
+                float(os.getenv("ONTOLOGY_CACHE_TTL_SEC", "30")),
+            )
+            self.preprocess_max_workers = max(3, int(os.getenv("PREPROCESS_MAX_WORKERS", "6")))
+            self._preprocess_executor = ThreadPoolExecutor(
+                max_workers=self.preprocess_max_workers,
+                thread_name_prefix="preprocess",
+            )
 
             openai_api_key = os.getenv("OPENAI_API_KEY")
             if not openai_api_key:
@@ -133,6 +172,11 @@ class ChatBotService:
                 1,
                 min(int(os.getenv("WEB_SEARCH_FALLBACK_MAX_RESULTS", "5")), 10),
             )
+            # KAIST 한정 웹 검색이 이 시간(초) 안에 끝나지 않으면 일반 검색을 미리 시작한다(0이면 항상 순차).
+            self.web_search_fallback_hedge_sec = max(
+                0.0,
+                float(os.getenv("WEB_SEARCH_FALLBACK_HEDGE_SEC", "1.5")),
+            )
 
             print("🚀 ChatBot 서비스 초기화 중...")
 
@@ -167,16 +211,25 @@ class ChatBotService:
                     timeout_sec=max(4, int(os.getenv("WEB_SEARCH_TIMEOUT_SEC", "8"))),
                     region=os.getenv("WEB_SEARCH_REGION", "kr-kr"),
                     debug=self.debug_hierarchy_search,
+                    cache_ttl_sec=int(os.getenv("WEB_SEARCH_CACHE_TTL_SEC", "300")),
                 )
 
-            print("🔄 시스템 워밍업 중...")
-            boot_input = "이 메세지는 백엔드 서버 부팅 시 llm의 부팅 및 JSON 파싱을 위해 사용됩니다. 해당 메세지를 무시하세요."
-            try:
-                self.normalizer.normalize_input(boot_input)
-                self.checker.check_input(boot_input)
-                print("✅ 시스템 워밍업 완료!")
-            except Exception as e:
-                print(f"⚠️ 워밍업 중 경고: {e}")
+            # 워밍업은 과금되는 LLM 호출 두 번이므로, 스크립트/개발용 재시작에서는 LLM_WARMUP=0으로 끌 수 있다.
+            if os.getenv("LLM_WARMUP", "1") == "1":
+                print("🔄 시스템 워밍업 중...")
+                boot_input = "이 메세지는 백엔드 서버 부팅 시 llm의 부팅 및 JSON 파싱을 위해 사용됩니다. 해당 메세지를 무시하세요."
+                try:
+                    warmup_futures = [
+                        self._preprocess_executor.submit(self.normalizer.normalize_input, boot_input),
+                        self._preprocess_executor.submit(self.checker.check_input, boot_input),
+                    ]
+                    for future in warmup_futures:
+                        future.result()
+                    print("✅ 시스템 워밍업 완료!")
+                except Exception as e:
+                    print(f"⚠️ 워밍업 중 경고: {e}")
+            else:
+                print("⏭️ LLM_WARMUP=0: 시스템 워밍업을 건너뜁니다.")
 
             self.is_initialized = True
             print("✅ ChatBot 서비스 초기화 완료!")
@@ -206,10 +259,12 @@ class ChatBotService:
     @staticmethod
     def _dedupe_keep_order(items: List[str], max_items: int) -> List[str]:
         out: List[str] = []
+        seen: set[str] = set()
         for item in items:
             cleaned = " ".join(str(item).split()).strip()
-            if not cleaned or cleaned in out:
+            if not cleaned or cleaned in seen:
                 continue
+            seen.add(cleaned)
             out.append(cleaned)
             if len(out) >= max_items:
                 break
@@ -217,13 +272,12 @@ class ChatBotService:
 
     @staticmethod
     def _sanitize_keywords(keywords: List[str], max_keywords: int = 8) -> List[str]:
-        stopwords = {"최근", "요즘", "이번", "최신", "정보", "질문", "알려줘", "알려주세요", "문의"}
         deduped = ChatBotService._dedupe_keep_order(keywords, max_items=max_keywords * 2)
         out: List[str] = []
         for keyword in deduped:
             if len(keyword) < 2:
                 continue
-            if keyword in stopwords:
+            if keyword in KEYWORD_STOPWORDS:
                 continue
             out.append(keyword)
             if len(out) >= max_keywords:
@@ -232,7 +286,7 @@ class ChatBotService:
 
     @staticmethod
     def _extract_literal_keywords(text: str, max_keywords: int = 8) -> List[str]:
-        tokens = re.findall(r"[A-Za-z][A-Za-z0-9._/-]{1,}|[가-힣]{2,}", text or "")
+        tokens = LITERAL_KEYWORD_PATTERN.findall(text or "")
         return ChatBotService._dedupe_keep_order(tokens, max_items=max_keywords)
 
     @staticmethod
@@ -296,7 +350,7 @@ class ChatBotService:
         if not self.hierarchy_trace_log_enabled and not self.hierarchy_trace_console_enabled:
             return
 
-        now_kst = datetime.now(ZoneInfo("Asia/Seoul")).isoformat()
+        now_kst = datetime.now(KST).isoformat()
         summary_lines = self._summarize_hierarchy_trace(
             hierarchy_result.trace,
             max_lines=self.hierarchy_trace_console_max_lines,
@@ -376,6 +430,7 @@ class ChatBotService:
         docs = self.vector_searcher.fetch_full_documents_by_doc_ids(
             doc_ids,
             max_docs=self.hierarchy_final_context_docs,
+            max_chars_per_doc=self.hierarchy_final_context_max_chars_per_doc,
         )
         return self.vector_searcher.format_full_documents_context(
             docs,
@@ -398,15 +453,32 @@ class ChatBotService:
             search_query = f"{query} {' '.join(merged_keywords)}".strip()
 
         kaist_scoped_query = f"{search_query} site:kaist.ac.kr".strip()
-        web_results = self.web_fallback_searcher.search(
+        # KAIST 한정 결과가 있으면 그것만 쓰고, 없을 때만 일반 질의 결과를 쓴다.
+        # 두 질의를 항상 함께 보내면 스크래핑 요청이 두 배가 되어 차단될 가능성이 커지므로,
+        # 한정 검색이 hedge 시간 안에 끝나지 않은 경우에만 일반 검색을 미리 시작한다.
+        scoped_future = self._preprocess_executor.submit(
+            self.web_fallback_searcher.search,
             kaist_scoped_query,
             max_results=self.web_search_fallback_max_results,
         )
-        if not web_results:
-            web_results = self.web_fallback_searcher.search(
+        general_future = None
+        try:
+            web_results = scoped_future.result(timeout=self.web_search_fallback_hedge_sec or None)
+        except FutureTimeoutError:
+            general_future = self._preprocess_executor.submit(
+                self.web_fallback_searcher.search,
                 search_query,
                 max_results=self.web_search_fallback_max_results,
             )
+            web_results = scoped_future.result()
+        if not web_results:
+            if general_future is not None:
+                web_results = general_future.result()
+            else:
+                web_results = self.web_fallback_searcher.search(
+                    search_query,
+                    max_results=self.web_search_fallback_max_results,
+                )
         if not web_results:
             return ""
 
@@ -450,6 +522,20 @@ class ChatBotService:
         return text
 
     def get_ontology_tree(self) -> Dict[str, Any]:
+        if self.ontology_cache_ttl_sec > 0:
+            with self._ontology_cache_lock:
+                cached = self._ontology_cache
+            # 호출자가 트리를 수정해도 캐시 원본이 바뀌지 않도록 복사본을 돌려준다.
+            if cached is not None and time.monotonic() - cached[0] < self.ontology_cache_ttl_sec:
+                return copy.deepcopy(cached[1])
+
+        tree = self._build_ontology_tree()
+        if self.ontology_cache_ttl_sec > 0:
+            with self._ontology_cache_lock:
+                self._ontology_cache = (time.monotonic(), copy.deepcopy(tree))
+        return tree
+
+    def _build_ontology_tree(self) -> Dict[str, Any]:
         data_root = (self.project_root / "data").resolve()
         if not data_root.exists():
             raise FileNotFoundError(f"data 폴더가 없습니다: {data_root}")
@@ -539,7 +625,7 @@ class ChatBotService:
 
         return {
             "success": True,
-            "generated_at_kst": datetime.now(ZoneInfo("Asia/Seoul")).isoformat(),
+            "generated_at_kst": datetime.now(KST).isoformat(),
             "entity_count": len(nodes_by_id),
             "root": root_node,
             "top_level_entities": roots if root_node is None or root_node.get("entity_id") == "virtual_root" else root_node.get("children", []),
@@ -554,37 +640,114 @@ class ChatBotService:
             }
 
         try:
-            trace_id = uuid4().hex[:12]
-            print(f"📝 사용자 질문 처리 중(trace_id={trace_id}): {user_input}")
+            prepared = self._prepare_response(user_input, use_vector_search)
+            if "result" in prepared:
+                return prepared["result"]
 
-            # 1) 정규화
-            search_keywords: List[str] = []
-            normalized_query = user_input
-            try:
-                normalized_result = self.normalizer.normalize_input_with_keywords(user_input)
-                normalized_query = normalized_result.get("output", user_input)
-                search_keywords = normalized_result.get("keywords", []) or []
-                print(f"📝 정규화된 질문: {normalized_query}")
-            except Exception as e:
-                print(f"⚠️ 입력 정규화 중 오류: {e}")
-
-            effective_keywords = self._sanitize_keywords(search_keywords, max_keywords=8)
-            if effective_keywords:
-                print(f"🔑 검색 키워드: {effective_keywords}")
-            literal_keywords = self._extract_literal_keywords(user_input, max_keywords=8)
-            planner_seed_keywords = self._sanitize_keywords(
-                effective_keywords + literal_keywords,
-                max_keywords=10,
+            response = self.openai_chatbot.generate_response(**prepared["generate_kwargs"])
+            return {
+                "success": True,
+                "response": response,
+                "message": prepared["message"],
+            }
+
+        except Exception as e:
+            print(f"❌ 메시지 처리 중 예상치 못한 오류: {e}")
+            return {
+                "success": False,
+                "response": f"메시지 처리 중 오류가 발생했습니다: {str(e)}",
+                "error": str(e),
+            }
+
+    def process_message_stream(self, user_input: str, use_vector_search: bool = True) -> Iterator[str]:
+        """
+        process_message와 같은 검색 과정을 거친 뒤 최종 답변을 토큰 단위로 스트리밍한다.
+        검색 단계에서 끝나는 응답(유효하지 않은 질문, 근거 문서 없음 등)은 한 번에 내보낸다.
+        """
+        if not self.is_initialized:
+            yield "서비스가 초기화되지 않았습니다."
+            return
+
+        try:
+            prepared = self._prepare_response(user_input, use_vector_search)
+        except Exception as e:
+            print(f"❌ 메시지 처리 중 예상치 못한 오류: {e}")
+            yield f"메시지 처리 중 오류가 발생했습니다: {str(e)}"
+            return
+
+        if "result" in prepared:
+            yield prepared["result"]["response"]
+            return
+
+        yield from self.openai_chatbot.generate_response_stream(**prepared["generate_kwargs"])
+
+    def _prepare_response(self, user_input: str, use_vector_search: bool) -> Dict[str, Any]:
+        """
+        정규화 → 유효성 검사 → 날짜 필터 → 계층 검색까지 수행한다.
+
+        Returns:
+            Dict[str, Any]: 검색 단계에서 응답이 확정되면 {"result": 응답 dict},
+                최종 답변 생성이 필요하면 {"generate_kwargs": 생성 인자, "message": 상태 메시지}
+        """
+        trace_id = uuid4().hex[:12]
+        print(f"📝 사용자 질문 처리 중(trace_id={trace_id}): {user_input}")
+
+        # 정규화·유효성 검사·날짜 필터는 모두 원문만 입력으로 받으므로 LLM 호출을 동시에 보낸다.
+        # 유효하지 않은 질문이면 나머지 결과는 버려지지만, 지연 시간은 세 호출의 합이 아니라 최댓값이 된다.
+        # 날짜 필터와 최종 답변이 같은 기준 날짜를 쓰도록 요청 시작 시 한 번만 계산한다.
+        today_kst = datetime.now(KST).date()
+        current_kst_date = today_kst.isoformat()
+        normalize_future = self._preprocess_executor.submit(
+            self.normalizer.normalize_input_with_keywords,
+            user_input,
+        )
+        # SoC 키워드가 있으면 항상 유효한 질문으로 보므로, 결과와 무관한 검증 LLM 호출을 아예 보내지 않는다.
+        is_soc_query = self._looks_like_soc_query(user_input)
+        check_future = (
+            None
+            if is_soc_query
+            else self._preprocess_executor.submit(self.checker.check_input, user_input)
+        )
+        date_filter_future = (
+            self._preprocess_executor.submit(
+                self.date_filter_extractor.extract,
+                user_input,
+                today=today_kst,
             )
+            if self.date_filter_extractor
+            else None
+        )
 
-            # 2) 유효성 검사
-            try:
-                is_valid = self.checker.check_input(user_input)
-                if not is_valid and self._looks_like_soc_query(user_input):
-                    print("⚠️ inputChecker가 false를 반환했지만 SoC 관련 키워드가 있어 통과시킵니다.")
-                    is_valid = True
-                if not is_valid:
-                    return {
+        # 1) 정규화
+        search_keywords: List[str] = []
+        normalized_query = user_input
+        try:
+            normalized_result = normalize_future.result()
+            normalized_query = normalized_result.get("output", user_input)
+            search_keywords = normalized_result.get("keywords", []) or []
+            print(f"📝 정규화된 질문: {normalized_query}")
+        except Exception as e:
+            print(f"⚠️ 입력 정규화 중 오류: {e}")
+
+        effective_keywords = self._sanitize_keywords(search_keywords, max_keywords=8)
+        if effective_keywords:
+            print(f"🔑 검색 키워드: {effective_keywords}")
+        literal_keywords = self._extract_literal_keywords(user_input, max_keywords=8)
+        planner_seed_keywords = self._sanitize_keywords(
+            effective_keywords + literal_keywords,
+            max_keywords=10,
+        )
+
+        # 2) 유효성 검사
+        try:
+            if is_soc_query:
+                print("🔑 SoC 관련 키워드가 있어 입력 검증 LLM 호출을 생략합니다.")
+                is_valid = True
+            else:
+                is_valid = check_future.result()
+            if not is_valid:
+                return {
+                    "result": {
                         "success": False,
                         "response": (
                             "죄송합니다. 해당 질문은 KAIST 전산학부 관련 질문이 아닌 것 같습니다. "
@@ -592,117 +755,114 @@ class ChatBotService:
                         ),
                         "error": "Invalid input",
                     }
-            except Exception as e:
-                print(f"⚠️ 입력 검증 중 오류: {e}")
-                print("⚠️ 입력 검증을 건너뛰고 계속 진행합니다.")
-
-            # 3) 날짜 필터 추출
-            today_kst = datetime.now(ZoneInfo("Asia/Seoul")).date()
-            date_filter = (
-                self.date_filter_extractor.extract(user_input, today=today_kst)
-                if self.date_filter_extractor
-                else None
-            )
-            start_date = date_filter.start_date if date_filter else None
-            end_date = date_filter.end_date if date_filter else None
-            if date_filter and date_filter.has_filter():
-                print(f"🗓️ 날짜 필터 적용: {start_date} ~ {end_date}")
-
-            # 4) 계층형 검색 (SQL 완전 비활성)
-            vector_context = ""
-            used_doc_ids: List[str] = []
-            hierarchy_result: Optional[HierarchicalSearchResult] = None
-            hierarchy_query = normalized_query
-            if normalized_query.strip() != user_input.strip():
-                hierarchy_query = f"{normalized_query}\n원문 질의: {user_input}"
-            if use_vector_search and self.hierarchical_search_orchestrator is not None:
-                try:
-                    hierarchy_result = self.hierarchical_search_orchestrator.search(
-                        query=hierarchy_query,
-                        seed_keywords=planner_seed_keywords,
-                        start_date=start_date,
-                        end_date=end_date,
-                    )
-                    used_doc_ids = hierarchy_result.final_doc_ids
-
-                    if self.debug_hierarchy_search:
-                        print(
-                            "🔎 계층 검색 결과:",
-                            {
-                                "doc_id_count": len(hierarchy_result.final_doc_ids),
-                                "used_entities": hierarchy_result.used_entities,
-                                "used_keywords": hierarchy_result.used_keywords,
-                            },
-                        )
-
-                    docs = self.vector_searcher.fetch_full_documents_by_doc_ids(
-                        hierarchy_result.final_doc_ids,
-                        max_docs=self.hierarchy_final_context_docs,
-                    )
-                    vector_context = self.vector_searcher.format_full_documents_context(
-                        docs,
-                        max_docs=self.hierarchy_final_context_docs,
-                        max_chars_per_doc=self.hierarchy_final_context_max_chars_per_doc,
-                        max_total_chars=self.hierarchy_final_context_max_chars,
-                    )
-                    self._log_hierarchy_search_trace(
-                        trace_id=trace_id,
-                        user_input=user_input,
-                        normalized_query=normalized_query,
-                        hierarchy_query=hierarchy_query,
-                        planner_seed_keywords=planner_seed_keywords,
-                        start_date=start_date,
-                        end_date=end_date,
-                        hierarchy_result=hierarchy_result,
-                        vector_context_len=len(vector_context),
+                }
+        except Exception as e:
+            print(f"⚠️ 입력 검증 중 오류: {e}")
+            print("⚠️ 입력 검증을 건너뛰고 계속 진행합니다.")
+
+        # 3) 날짜 필터 추출
+        date_filter = date_filter_future.result() if date_filter_future else None
+        start_date = date_filter.start_date if date_filter else None
+        end_date = date_filter.end_date if date_filter else None
+        if date_filter and date_filter.has_filter():
+            print(f"🗓️ 날짜 필터 적용: {start_date} ~ {end_date}")
+
+        # 4) 계층형 검색 (SQL 완전 비활성)
+        vector_context = ""
+        used_doc_ids: List[str] = []
+        hierarchy_result: Optional[HierarchicalSearchResult] = None
+        hierarchy_query = normalized_query
+        if normalized_query.strip() != user_input.strip():
+            hierarchy_query = f"{normalized_query}\n원문 질의: {user_input}"
+        if use_vector_search and self.hierarchical_search_orchestrator is not None:
+            try:
+                hierarchy_result = self.hierarchical_search_orchestrator.search(
+                    query=hierarchy_query,
+                    seed_keywords=planner_seed_keywords,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                used_doc_ids = hierarchy_result.final_doc_ids
+
+                if self.debug_hierarchy_search:
+                    print(
+                        "🔎 계층 검색 결과:",
+                        {
+                            "doc_id_count": len(hierarchy_result.final_doc_ids),
+                            "used_entities": hierarchy_result.used_entities,
+                            "used_keywords": hierarchy_result.used_keywords,
+                        },
                     )
-                except FileNotFoundError as e:
-                    # level0.md/entity.md 계약 위반 시 명시적 에러
-                    return {
+
+                docs = self.vector_searcher.fetch_full_documents_by_doc_ids(
+                    hierarchy_result.final_doc_ids,
+                    max_docs=self.hierarchy_final_context_docs,
+                    max_chars_per_doc=self.hierarchy_final_context_max_chars_per_doc,
+                )
+                vector_context = self.vector_searcher.format_full_documents_context(
+                    docs,
+                    max_docs=self.hierarchy_final_context_docs,
+                    max_chars_per_doc=self.hierarchy_final_context_max_chars_per_doc,
+                    max_total_chars=self.hierarchy_final_context_max_chars,
+                )
+                self._log_hierarchy_search_trace(
+                    trace_id=trace_id,
+                    user_input=user_input,
+                    normalized_query=normalized_query,
+                    hierarchy_query=hierarchy_query,
+                    planner_seed_keywords=planner_seed_keywords,
+                    start_date=start_date,
+                    end_date=end_date,
+                    hierarchy_result=hierarchy_result,
+                    vector_context_len=len(vector_context),
+                )
+            except FileNotFoundError as e:
+                # level0.md/entity.md 계약 위반 시 명시적 에러
+                return {
+                    "result": {
                         "success": False,
                         "response": str(e),
                         "error": "Hierarchy metadata missing",
                     }
-                except Exception as e:
-                    print(f"⚠️ 계층형 검색 실패: {e}")
-                    vector_context = self._fallback_vector_context(
-                        normalized_query,
-                        planner_seed_keywords,
-                        start_date,
-                        end_date,
-                    )
-            elif use_vector_search:
+                }
+            except Exception as e:
+                print(f"⚠️ 계층형 검색 실패: {e}")
                 vector_context = self._fallback_vector_context(
                     normalized_query,
                     planner_seed_keywords,
                     start_date,
                     end_date,
                 )
+        elif use_vector_search:
+            vector_context = self._fallback_vector_context(
+                normalized_query,
+                planner_seed_keywords,
+                start_date,
+                end_date,
+            )
 
-            if use_vector_search and not vector_context.strip():
-                web_context = self._fallback_web_context(
-                    normalized_query,
-                    planner_seed_keywords,
-                )
-                if web_context:
-                    current_kst_date = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
-                    response = self.openai_chatbot.generate_response(
-                        user_query=user_input,
-                        use_vector_search=False,
-                        start_date=start_date,
-                        end_date=end_date,
-                        search_keywords=effective_keywords,
-                        sql_context=None,
-                        vector_context=web_context,
-                        current_date_text=current_kst_date,
-                    )
-                    return {
-                        "success": True,
-                        "response": response,
-                        "message": "외부 웹 검색 fallback 응답",
-                    }
-
+        if use_vector_search and not vector_context.strip():
+            web_context = self._fallback_web_context(
+                normalized_query,
+                planner_seed_keywords,
+            )
+            if web_context:
                 return {
+                    "generate_kwargs": {
+                        "user_query": user_input,
+                        "use_vector_search": False,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "search_keywords": effective_keywords,
+                        "sql_context": None,
+                        "vector_context": web_context,
+                        "current_date_text": current_kst_date,
+                    },
+                    "message": "외부 웹 검색 fallback 응답",
+                }
+
+            return {
+                "result": {
                     "success": True,
                     "response": (
                         "현재 질의에 대해 신뢰할 만한 근거 문서를 찾지 못했습니다. "
@@ -710,58 +870,35 @@ class ChatBotService:
                     ),
                     "message": "근거 문서 없음",
                 }
-
-            # 5) 최종 답변 생성 (상위 고성능 모델, max_tokens 미지정)
-            current_kst_date = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
-            response = self.openai_chatbot.generate_response(
-                user_query=user_input,
-                use_vector_search=False,
-                start_date=start_date,
-                end_date=end_date,
-                search_keywords=effective_keywords,
-                sql_context=None,
-                vector_context=vector_context,
-                current_date_text=current_kst_date,
-            )
-
-            debug_message = "답변 생성 완료"
-            if self.debug_hierarchy_search and used_doc_ids:
-                debug_message = f"답변 생성 완료 (doc_ids={len(used_doc_ids)})"
-
-            return {
-                "success": True,
-                "response": response,
-                "message": debug_message,
             }
 
-        except Exception as e:
-            print(f"❌ 메시지 처리 중 예상치 못한 오류: {e}")
-            return {
-                "success": False,
-                "response": f"메시지 처리 중 오류가 발생했습니다: {str(e)}",
-                "error": str(e),
-            }
+        # 5) 최종 답변 생성 (상위 고성능 모델, max_tokens 미지정)
+        debug_message = "답변 생성 완료"
+        if self.debug_hierarchy_search and used_doc_ids:
+            debug_message = f"답변 생성 완료 (doc_ids={len(used_doc_ids)})"
+
+        return {
+            "generate_kwargs": {
+                "user_query": user_input,
+                "use_vector_search": False,
+                "start_date": start_date,
+                "end_date": end_date,
+                "search_keywords": effective_keywords,
+                "sql_context": None,
+                "vector_context": vector_context,
+                "current_date_text": current_kst_date,
+            },
+            "message": debug_message,
+        }
 
     @staticmethod
     def _looks_like_soc_query(text: str) -> bool:
-        keywords = [
-            "전산학부",
-            "soc",
-            "kaist",
-            "학생회",
-            "집행위",
-            "학사",
-            "교수",
-            "수강",
-            "행사",
-            "공지",
-        ]
-        lowered = (text or "").lower()
-        return any(k in lowered for k in keywords)
+        return SOC_QUERY_PATTERN.search((text or "").lower()) is not None
 
 
 # 전역 서비스 인스턴스 (서버 시작시 한 번만 생성)
 chatbot_service = None
+_chatbot_service_lock = threading.Lock()
 
 
 def get_chatbot_service() -> ChatBotService:
@@ -770,6 +907,10 @@ def get_chatbot_service() -> ChatBotService:
     FastAPI dependency injection에서 사용
     """
     global chatbot_service
-    if chatbot_service is None:
-        chatbot_service = ChatBotService()
+    if chatbot_service is not None:
+        return chatbot_service
+    # 동시에 들어온 첫 요청들이 초기화(워밍업 포함)를 중복 실행하지 않도록 한 번만 통과시킨다.
+    with _chatbot_service_lock:
+        if chatbot_service is None:
+            chatbot_service = ChatBotService()
     return chatbot_service
@@ -3,8 +3,9 @@ KAIST 전산학부 ChatBot FastAPI 서버
 """
 
 from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
 import uvicorn
 import logging
@@ -101,6 +102,7 @@ async def api_info():
             "GET /info": "API 정보 조회",
             "GET /ontology": "온톨로지 계층 조회",
             "POST /chat": "채팅 응답 생성",
+            "POST /chat/stream": "채팅 응답 스트리밍 생성",
         },
     }
 
@@ -137,7 +139,10 @@ async def chat(
     try:
         logger.info(f"채팅 요청 수신: {request.message[:100]}...")
         
-        result = service.process_message(
+        # process_message는 LLM/DB 호출로 수 초간 블로킹되므로 스레드풀에서 실행해
+        # 그동안 이벤트 루프가 다른 요청(헬스체크, 스트리밍 등)을 처리할 수 있게 한다.
+        result = await run_in_threadpool(
+            service.process_message,
             user_input=request.message,
             use_vector_search=request.use_vector_search
         )
@@ -165,6 +170,26 @@ async def chat(
         )
 
 
+@app.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    service: ChatBotService = Depends(get_chatbot_service)
+):
+    """
+    스트리밍 채팅 엔드포인트
+    최종 답변을 생성되는 대로 text/plain 청크로 전달
+    """
+    logger.info(f"스트리밍 채팅 요청 수신: {request.message[:100]}...")
+    # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않는다.
+    return StreamingResponse(
+        service.process_message_stream(
+            user_input=request.message,
+            use_vector_search=request.use_vector_search
+        ),
+        media_type="text/plain; charset=utf-8",
+    )
+
+
 # 예외 처리 핸들러
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
@@ -20,6 +20,15 @@ POSTGRES_DB = os.environ.get("POSTGRES_DB", "postgres")
 POSTGRES_USER = os.environ.get("POSTGRES_USER", "postgres")
 POSTGRES_PASSWORD = os.environ.get("POSTGRES_PASSWORD", "")
 PGVECTOR_TABLE = os.environ.get("PGVECTOR_TABLE", "documents")
+# 재사용할 유휴 커넥션 수와 유휴 커넥션을 버리기까지의 시간(초)
+# 한 질문의 벡터 검색이 키워드(기본 4) x 컬렉션(기본 6) 단위로 동시에 커넥션을 빌리므로,
+# 그만큼은 반납 후에도 남겨 두어야 다음 질문에서 연결/인증을 다시 하지 않는다.
+POOL_MAX_IDLE = int(os.environ.get("PGVECTOR_POOL_MAX_IDLE", "24"))
+POOL_MAX_IDLE_SEC = float(os.environ.get("PGVECTOR_POOL_MAX_IDLE_SEC", "300"))
+# 동시에 열어 둘 수 있는 최대 커넥션 수와, 가득 찼을 때 빈 커넥션을 기다리는 최대 시간(초)
+# 여러 질문이 동시에 병렬 검색을 해도 Postgres max_connections를 넘지 않도록 상한을 둔다.
+POOL_MAX_SIZE = int(os.environ.get("PGVECTOR_POOL_MAX_SIZE", "32"))
+POOL_ACQUIRE_TIMEOUT_SEC = float(os.environ.get("PGVECTOR_POOL_ACQUIRE_TIMEOUT_SEC", "30"))
 
 # 임베딩 설정
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
@@ -27,6 +36,14 @@ OPENAI_EMBEDDING_MODEL = os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embeddin
 VECTOR_SIZE = int(os.environ.get("OPENAI_EMBEDDING_DIM", "1536"))
 CHUNK_SIZE = int(os.environ.get("EMBEDDING_CHUNK_SIZE", "1000"))
 CHUNK_OVERLAP = int(os.environ.get("EMBEDDING_CHUNK_OVERLAP", "120"))
+# 임베딩 API 요청 한 번에 보낼 최대 입력 수
+EMBEDDING_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", "128"))
+# 검색 질의 임베딩을 메모리에 보관할 최대 개수(LRU)
+QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get("QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+# 폴더 적재 시 한 트랜잭션으로 묶어 보낼 문서 수
+UPSERT_BATCH_SIZE = int(os.environ.get("VECTOR_UPSERT_BATCH_SIZE", "32"))
+# 폴더 적재 시 동시에 처리할 배치 수
+UPSERT_WORKERS = int(os.environ.get("VECTOR_UPSERT_WORKERS", "4"))
 
 # 컬렉션 형식 정의
 FORMATS = {
@@ -1,22 +1,43 @@
 import csv
-import io
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
 
-import pdfplumber
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
-    from .vector_db_helper import create_doc_upsert, get_pgvector_client, ensure_schema
+    from .config import UPSERT_BATCH_SIZE
+    from .vector_db_helper import create_docs_upsert_isolated, get_pgvector_client, ensure_schema
 except ImportError:
-    from vector_db_helper import create_doc_upsert, get_pgvector_client, ensure_schema  # type: ignore
+    from config import UPSERT_BATCH_SIZE  # type: ignore
+    from vector_db_helper import create_docs_upsert_isolated, get_pgvector_client, ensure_schema  # type: ignore
+
+# 같은 drive.google.com 호스트로 여러 파일을 내려받으므로 keep-alive 세션을 공유해
+# 행마다 TCP/TLS 핸드셰이크를 반복하지 않는다. 풀 크기는 동시 처리 워커 수를 넉넉히 덮도록 잡는다.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# 내려받은 PDF는 이 크기까지만 메모리에 두고, 더 크면 임시 파일로 넘긴다.
+PDF_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+PDF_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# 행/줄마다 쓰는 정규식은 모듈 로드 때 한 번만 컴파일한다.
+GOOGLE_DOC_LINK_PATTERN = re.compile(r"docs\.google\.com/document/d/")
+DRIVE_FILE_LINK_PATTERN = re.compile(r"drive\.google\.com/file/d/")
+DRIVE_FILE_ID_PATTERN = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+DISALLOWED_CHAR_PATTERN = re.compile(r"[^0-9A-Za-z가-힣\s.,!?\-()]")
 
 
 def classify_file_type(link: str) -> str:
-    if re.search(r"docs\.google\.com/document/d/", link):
+    if GOOGLE_DOC_LINK_PATTERN.search(link):
         return "word"
-    if re.search(r"drive\.google\.com/file/d/", link):
+    if DRIVE_FILE_LINK_PATTERN.search(link):
         return "pdf"
     return "unknown"
 
@@ -26,17 +47,27 @@ def drive2db(date: str, link: str, doc_id: int) -> Dict[str, Any]:
     file_type = classify_file_type(link)
 
     if file_type == "pdf":
-        link_id = re.search(r"/d/([a-zA-Z0-9_-]+)", link)
+        # pdfplumber(pdfminer/Pillow)는 무거우므로 PDF를 실제로 파싱할 때만 불러온다.
+        # 파싱 오류 처리 밖에서 불러와, 의존성 누락이 "PARSING ERROR" 본문으로 적재되지 않고 그대로 드러나게 한다.
+        import pdfplumber
+
+        link_id = DRIVE_FILE_ID_PATTERN.search(link)
         if not link_id:
             return {"date": date, "link": link, "content": "INVALID DRIVE LINK", "id": doc_id}
 
         file_id = link_id.group(1)
         download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
+        # 본문 전체를 메모리에 올리지 않도록 일정 크기까지만 메모리에 두고 넘치면 임시 파일로 흘려 쓴다.
+        file_stream = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES)
         try:
-            response = requests.get(download_url, stream=True, timeout=30)
-            response.raise_for_status()
-            file_stream = io.BytesIO(response.content)
+            with SESSION.get(download_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                # iter_content는 전송 인코딩을 풀고 중간 끊김도 RequestException으로 감싸 준다.
+                for chunk in response.iter_content(chunk_size=PDF_DOWNLOAD_CHUNK_BYTES):
+                    file_stream.write(chunk)
+            file_stream.seek(0)
         except requests.RequestException as e:
+            file_stream.close()
             return {"date": date, "link": link, "content": f"DOWNLOAD ERROR: {e}", "id": doc_id}
 
         try:
@@ -46,8 +77,7 @@ def drive2db(date: str, link: str, doc_id: int) -> Dict[str, Any]:
                     if page_text:
                         lines = page_text.split("\n")
                         for line in lines:
-                            cleaned_line = " ".join(line.strip().split())
-                            cleaned_line = re.sub(r"[^0-9A-Za-z가-힣\s.,!?\-()]", "", cleaned_line)
+                            cleaned_line = DISALLOWED_CHAR_PATTERN.sub("", " ".join(line.split()))
                             if cleaned_line:
                                 full_text.append(cleaned_line)
 
@@ -56,6 +86,8 @@ def drive2db(date: str, link: str, doc_id: int) -> Dict[str, Any]:
                     full_text.append(f"<PAGE_BREAK:{page_index}>")
         except Exception as e:
             return {"date": date, "link": link, "content": f"PARSING ERROR: {e}", "id": doc_id}
+        finally:
+            file_stream.close()
 
     elif file_type == "word":
         return {"date": date, "link": link, "content": "WORD TYPE IS NOT SUPPORTED YET", "id": doc_id}
@@ -70,23 +102,52 @@ def drive2db(date: str, link: str, doc_id: int) -> Dict[str, Any]:
     }
 
 
-def drive_upsert_all(client, file_path: str) -> None:
+def _drive2db_row(date: str, link: str, doc_id: int) -> Dict[str, Any] | None:
+    try:
+        return drive2db(date, link, doc_id)
+    except ImportError:
+        # 의존성 누락은 행마다 건너뛸 문제가 아니므로 적재 전체를 중단한다.
+        raise
+    except Exception as e:
+        print(f"Error: failed to fetch row {doc_id} ({link}): {e}")
+        return None
+
+
+def drive_upsert_all(
+    client,
+    file_path: str,
+    max_workers: int | None = None,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    # 행마다 다운로드/파싱이 독립적이므로 여러 행을 동시에 처리한다.
+    if max_workers is None:
+        max_workers = int(os.getenv("DRIVE_UPSERT_WORKERS", "4"))
     try:
         with open(file_path, "r", newline="", encoding="utf-8") as csvfile:
             reader = csv.DictReader(csvfile)
-            row_count = 1
-
-            for row in reader:
+            jobs = []
+            for row_count, row in enumerate(reader, start=1):
                 if "date" not in row or "link" not in row:
                     print(f"Warning: row {row_count} has invalid columns.")
-                    row_count += 1
                     continue
-
-                data = drive2db(row["date"], row["link"], row_count)
-                create_doc_upsert(client, "drive", data)
-                row_count += 1
+                jobs.append((row["date"], row["link"], row_count))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            docs = list(executor.map(lambda job: _drive2db_row(*job), jobs))
+
+        # 행마다 임베딩 API와 DB를 따로 호출하지 않고, 여러 행의 chunk를 배치 단위로 묶어 적재한다.
+        doc_jobs = [(job, doc) for job, doc in zip(jobs, docs) if doc is not None]
+        batch_size = max(1, batch_size)
+        for start in range(0, len(doc_jobs), batch_size):
+            batch = doc_jobs[start:start + batch_size]
+            # 배치가 실패하면 행별로 다시 적재되므로, 실패는 문제 행만 보고된다.
+            _, failures = create_docs_upsert_isolated(client, "drive", [doc for _, doc in batch])
+            for doc, error in failures:
+                print(f"Error: failed to upsert row {doc.get('id')} ({doc.get('link')}): {error}")
     except FileNotFoundError:
         print(f"Error: file not found: {file_path}")
+    except ImportError:
+        raise
     except Exception as e:
         print(f"Error: failed to process CSV: {e}")
 
@@ -10,6 +10,8 @@ try:
         OPENAI_EMBEDDING_MODEL,
         CHUNK_SIZE,
         CHUNK_OVERLAP,
+        EMBEDDING_BATCH_SIZE,
+        QUERY_EMBEDDING_CACHE_SIZE,
     )
 except ImportError:
     from config import (  # type: ignore
@@ -17,10 +19,14 @@ except ImportError:
         OPENAI_EMBEDDING_MODEL,
         CHUNK_SIZE,
         CHUNK_OVERLAP,
+        EMBEDDING_BATCH_SIZE,
+        QUERY_EMBEDDING_CACHE_SIZE,
     )
 
 
+@lru_cache(maxsize=1)
 def _get_client() -> OpenAI:
+    # 임베딩 호출마다 새 클라이언트(커넥션 풀)를 만들지 않도록 프로세스 단위로 재사용한다.
     if not OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY is not set.")
     return OpenAI(api_key=OPENAI_API_KEY)
@@ -84,11 +90,16 @@ def embed_texts(texts: List[str]) -> List[List[float]]:
         return []
 
     client = _get_client()
-    response = client.embeddings.create(
-        model=OPENAI_EMBEDDING_MODEL,
-        input=texts,
-    )
-    return [item.embedding for item in response.data]
+    batch_size = max(1, EMBEDDING_BATCH_SIZE)
+    vectors: List[List[float]] = []
+    # 요청당 입력 개수 제한을 넘지 않도록 batch_size 단위로 나눠 보낸다.
+    for start in range(0, len(texts), batch_size):
+        response = client.embeddings.create(
+            model=OPENAI_EMBEDDING_MODEL,
+            input=texts[start:start + batch_size],
+        )
+        vectors.extend(item.embedding for item in response.data)
+    return vectors
 
 
 def embed_query(text: str) -> List[float]:
@@ -98,7 +109,7 @@ def embed_query(text: str) -> List[float]:
     return list(_embed_query_cached(normalized))
 
 
-@lru_cache(maxsize=512)
+@lru_cache(maxsize=max(0, QUERY_EMBEDDING_CACHE_SIZE))
 def _embed_query_cached(normalized_text: str) -> Tuple[float, ...]:
     vectors = embed_texts([normalized_text])
     if not vectors:
@@ -107,9 +118,19 @@ def _embed_query_cached(normalized_text: str) -> Tuple[float, ...]:
 
 
 def content_embedder(text: str) -> List[Tuple[str, List[float]]]:
-    chunks = split_text(text)
-    if not chunks:
-        return []
-
-    vectors = embed_texts(chunks)
-    return list(zip(chunks, vectors))
+    return content_embedder_many([text])[0]
+
+
+def content_embedder_many(texts: List[str]) -> List[List[Tuple[str, List[float]]]]:
+    """여러 문서의 chunk를 모아 한 번에 임베딩하고 문서별로 다시 나눠 돌려준다."""
+    chunks_per_text = [split_text(text) for text in texts]
+    # 머리말/서명처럼 문서 사이에 반복되는 chunk는 한 번만 임베딩한다.
+    unique_chunks = list(dict.fromkeys(chunk for chunks in chunks_per_text for chunk in chunks))
+    if not unique_chunks:
+        return [[] for _ in texts]
+
+    vector_by_chunk = dict(zip(unique_chunks, embed_texts(unique_chunks)))
+    return [
+        [(chunk, vector_by_chunk[chunk]) for chunk in chunks]
+        for chunks in chunks_per_text
+    ]
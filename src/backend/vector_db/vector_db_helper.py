@@ -1,11 +1,17 @@
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
 import psycopg
+from psycopg.pq import TransactionStatus
 
 try:
     from .config import (
@@ -16,9 +22,15 @@ try:
         POSTGRES_USER,
         POSTGRES_PASSWORD,
         PGVECTOR_TABLE,
+        POOL_MAX_IDLE,
+        POOL_MAX_IDLE_SEC,
+        POOL_MAX_SIZE,
+        POOL_ACQUIRE_TIMEOUT_SEC,
+        UPSERT_BATCH_SIZE,
+        UPSERT_WORKERS,
         VECTOR_SIZE,
     )
-    from .embedding import content_embedder, embed_query
+    from .embedding import content_embedder_many, embed_query
 except ImportError:
     from config import (  # type: ignore
         POSTGRES_DSN,
@@ -28,9 +40,15 @@ except ImportError:
         POSTGRES_USER,
         POSTGRES_PASSWORD,
         PGVECTOR_TABLE,
+        POOL_MAX_IDLE,
+        POOL_MAX_IDLE_SEC,
+        POOL_MAX_SIZE,
+        POOL_ACQUIRE_TIMEOUT_SEC,
+        UPSERT_BATCH_SIZE,
+        UPSERT_WORKERS,
         VECTOR_SIZE,
     )
-    from embedding import content_embedder, embed_query  # type: ignore
+    from embedding import content_embedder_many, embed_query  # type: ignore
 
 
 def _safe_ident(name: str) -> str:
@@ -43,7 +61,7 @@ def _vector_literal(vector: List[float]) -> str:
     return "[" + ",".join(f"{x:.8f}" for x in vector) + "]"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchHit:
     id: int
     score: float
@@ -51,8 +69,24 @@ class SearchHit:
 
 
 class PGVectorClient:
-    def __init__(self, dsn: Optional[str] = None):
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        max_idle_connections: int = POOL_MAX_IDLE,
+        max_idle_sec: float = POOL_MAX_IDLE_SEC,
+        max_connections: int = POOL_MAX_SIZE,
+        acquire_timeout_sec: float = POOL_ACQUIRE_TIMEOUT_SEC,
+    ):
         self.dsn = dsn or POSTGRES_DSN or self._build_dsn()
+        # 검색/적재마다 TCP 연결과 인증을 새로 하지 않도록 반납된 커넥션을 재사용한다.
+        self.max_idle_connections = max(0, int(max_idle_connections))
+        self.max_idle_sec = max(0.0, float(max_idle_sec))
+        self._idle: List[tuple[psycopg.Connection, float]] = []
+        self._idle_lock = threading.Lock()
+        # 빌려 간 커넥션(유휴 커넥션 제외) 수의 상한. 가득 차면 반납될 때까지 기다린다.
+        self.max_connections = max(1, int(max_connections))
+        self.acquire_timeout_sec = max(0.0, float(acquire_timeout_sec))
+        self._slots = threading.BoundedSemaphore(self.max_connections)
 
     def _build_dsn(self) -> str:
         return (
@@ -60,11 +94,81 @@ class PGVectorClient:
             f"user={POSTGRES_USER} password={POSTGRES_PASSWORD}"
         )
 
-    def connect(self) -> psycopg.Connection:
+    @contextmanager
+    def connect(self) -> Iterator[psycopg.Connection]:
+        """
+        풀에서 커넥션을 빌려 준다.
+        psycopg.Connection 컨텍스트처럼 정상 종료 시 commit, 예외 시 rollback 한 뒤 풀에 반납한다.
+        """
+        conn = self._acquire()
+        succeeded = False
+        try:
+            yield conn
+            if not conn.closed:
+                conn.commit()
+            succeeded = True
+        finally:
+            self._release(conn, succeeded)
+
+    def close(self) -> None:
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def _acquire(self) -> psycopg.Connection:
+        if not self._slots.acquire(timeout=self.acquire_timeout_sec):
+            raise psycopg.OperationalError(
+                f"timed out waiting for a pgvector connection (max {self.max_connections})"
+            )
+        try:
+            return self._take_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _take_connection(self) -> psycopg.Connection:
+        now = time.monotonic()
+        while True:
+            with self._idle_lock:
+                if not self._idle:
+                    break
+                conn, released_at = self._idle.pop()
+            # 오래 놀던 커넥션은 서버 측 idle timeout으로 끊겼을 수 있어 버린다.
+            if conn.closed or now - released_at > self.max_idle_sec:
+                conn.close()
+                continue
+            return conn
         return psycopg.connect(self.dsn)
 
-
+    def _release(self, conn: psycopg.Connection, succeeded: bool) -> None:
+        try:
+            self._return_connection(conn, succeeded)
+        finally:
+            self._slots.release()
+
+    def _return_connection(self, conn: psycopg.Connection, succeeded: bool) -> None:
+        if conn.closed:
+            return
+        if not succeeded:
+            try:
+                conn.rollback()
+            except psycopg.Error:
+                conn.close()
+                return
+        if conn.broken or conn.info.transaction_status != TransactionStatus.IDLE:
+            conn.close()
+            return
+        with self._idle_lock:
+            if len(self._idle) < self.max_idle_connections:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+
+@lru_cache(maxsize=1)
 def get_pgvector_client() -> PGVectorClient:
+    # 커넥션 풀을 프로세스 전체에서 공유하도록 클라이언트를 하나만 만든다.
     return PGVectorClient()
 
 
@@ -121,6 +225,17 @@ def _metadata_date_fields(metadata: Dict[str, Any]) -> tuple[Optional[date], Opt
     return event_date, start_date, end_date
 
 
+def _create_embedding_index(cur: psycopg.Cursor, table: str) -> None:
+    cur.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS {table}_embedding_ivfflat_idx
+        ON {table}
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100);
+        """
+    )
+
+
 def ensure_schema(client: PGVectorClient) -> None:
     table = _safe_ident(PGVECTOR_TABLE)
     dim = int(VECTOR_SIZE)
@@ -164,14 +279,7 @@ def ensure_schema(client: PGVectorClient) -> None:
             cur.execute(
                 f"CREATE INDEX IF NOT EXISTS {table}_end_date_idx ON {table} (end_date);"
             )
-            cur.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS {table}_embedding_ivfflat_idx
-                ON {table}
-                USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100);
-                """
-            )
+            _create_embedding_index(cur, table)
 
             # Existing rows backfill: metadata 내 date/start/finish를 날짜 컬럼에 반영
             cur.execute(
@@ -199,6 +307,28 @@ def ensure_schema(client: PGVectorClient) -> None:
         conn.commit()
 
 
+@contextmanager
+def bulk_load(client: PGVectorClient) -> Iterator[None]:
+    """
+    대량 적재 동안 ivfflat 임베딩 인덱스를 내려두고 적재가 끝나면 다시 만든다.
+    행마다 인덱스를 갱신하지 않아 적재가 빨라지고, ivfflat 클러스터 중심도
+    (빈 테이블이 아닌) 최종 데이터 기준으로 한 번에 계산된다.
+    적재 중 검색은 인덱스 없이 순차 스캔으로 동작한다.
+    """
+    table = _safe_ident(PGVECTOR_TABLE)
+    with client.connect() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP INDEX IF EXISTS {table}_embedding_ivfflat_idx;")
+        conn.commit()
+    try:
+        yield
+    finally:
+        with client.connect() as conn:
+            with conn.cursor() as cur:
+                _create_embedding_index(cur, table)
+            conn.commit()
+
+
 def initialize_col(client: PGVectorClient, col_name: str) -> None:
     table = _safe_ident(PGVECTOR_TABLE)
     with client.connect() as conn:
@@ -215,27 +345,36 @@ def _extract_raw_text(data: Dict[str, Any]) -> str:
     return ""
 
 
-def create_doc_upsert(client: PGVectorClient, col_name: str, data: Dict[str, Any]) -> None:
+def _doc_raw_text(col_name: str, data: Dict[str, Any]) -> str:
     if not data:
         print("Warning: Empty data provided to create_doc_upsert")
-        return
+        return ""
 
     raw_text = _extract_raw_text(data)
     if not raw_text:
         print(f"Warning: Empty content in data for collection {col_name}")
-        return
+    return raw_text
 
-    chunks = content_embedder(raw_text)
-    if not chunks:
-        print(f"Warning: No chunks generated for collection {col_name}")
-        return
 
-    source_id = str(
+def _doc_source_id(data: Dict[str, Any]) -> str:
+    return str(
         data.get("source_path")
         or data.get("id")
         or data.get("link")
         or ""
     )
+
+
+def _build_doc_rows(
+    col_name: str,
+    data: Dict[str, Any],
+    chunks: List[tuple[str, List[float]]],
+) -> Optional[tuple[str, List[tuple]]]:
+    if not chunks:
+        print(f"Warning: No chunks generated for collection {col_name}")
+        return None
+
+    source_id = _doc_source_id(data)
     metadata = dict(data)
     metadata.pop("content", None)
     metadata.pop("contents", None)
@@ -245,35 +384,112 @@ def create_doc_upsert(client: PGVectorClient, col_name: str, data: Dict[str, Any
         metadata["date"] = None
     event_date, start_date, end_date = _metadata_date_fields(metadata)
 
+    # metadata는 모든 chunk에서 동일하므로 한 번만 직렬화한다.
+    metadata_json = json.dumps(metadata, ensure_ascii=False)
+    rows = [
+        (
+            col_name,
+            source_id or None,
+            chunk_index,
+            _vector_literal(vector),
+            chunk_text,
+            event_date,
+            start_date,
+            end_date,
+            metadata_json,
+        )
+        for chunk_index, (chunk_text, vector) in enumerate(chunks)
+    ]
+    return source_id, rows
+
+
+def _write_doc_rows(cur: psycopg.Cursor, col_name: str, source_ids: List[str], rows: List[tuple]) -> None:
     table = _safe_ident(PGVECTOR_TABLE)
+    source_ids = [source_id for source_id in source_ids if source_id]
+    if source_ids:
+        cur.execute(
+            f"DELETE FROM {table} WHERE collection = %s AND source_id = ANY(%s);",
+            (col_name, source_ids),
+        )
+
+    # chunk마다 INSERT를 왕복하지 않고 executemany로 한 번에 전송한다(psycopg3 pipeline).
+    cur.executemany(
+        f"""
+        INSERT INTO {table}
+        (collection, source_id, chunk_index, embedding, content, event_date, start_date, end_date, metadata)
+        VALUES (%s, %s, %s, %s::vector, %s, %s, %s, %s, %s::jsonb);
+        """,
+        rows,
+    )
+
+
+def create_doc_upsert(client: PGVectorClient, col_name: str, data: Dict[str, Any]) -> None:
+    create_docs_upsert(client, col_name, [data])
+
+
+def create_docs_upsert(client: PGVectorClient, col_name: str, data_list: List[Dict[str, Any]]) -> int:
+    """
+    여러 문서를 하나의 커넥션/트랜잭션으로 적재한다.
+    문서마다 연결·DELETE·INSERT 왕복을 반복하지 않도록 묶어서 전송하고, 적재된 문서 수를 반환한다.
+    """
+    # 같은 source_id가 배치에 여러 번 있으면 단건 upsert처럼 마지막 문서만 남긴다.
+    # 버려질 문서까지 임베딩하지 않도록 임베딩 전에 먼저 합친다.
+    docs: Dict[Any, tuple[Dict[str, Any], str]] = {}
+    for idx, data in enumerate(data_list):
+        raw_text = _doc_raw_text(col_name, data)
+        if not raw_text:
+            continue
+        key = _doc_source_id(data) or idx
+        docs.pop(key, None)
+        docs[key] = (data, raw_text)
+    if not docs:
+        return 0
+
+    # 문서별로 임베딩 API를 호출하지 않고 배치 전체 chunk를 한 번에 임베딩한다.
+    chunks_per_doc = content_embedder_many([raw_text for _, raw_text in docs.values()])
+
+    prepared_docs: Dict[Any, List[tuple]] = {}
+    for key, (data, _), chunks in zip(docs.keys(), docs.values(), chunks_per_doc):
+        prepared = _build_doc_rows(col_name, data, chunks)
+        if prepared is not None:
+            prepared_docs[key] = prepared[1]
+
+    if not prepared_docs:
+        return 0
+
+    source_ids = [key for key in prepared_docs if isinstance(key, str)]
+    rows = [row for doc_rows in prepared_docs.values() for row in doc_rows]
     with client.connect() as conn:
         with conn.cursor() as cur:
-            if source_id:
-                cur.execute(
-                    f"DELETE FROM {table} WHERE collection = %s AND source_id = %s;",
-                    (col_name, source_id),
-                )
-
-            for chunk_index, (chunk_text, vector) in enumerate(chunks):
-                cur.execute(
-                    f"""
-                    INSERT INTO {table}
-                    (collection, source_id, chunk_index, embedding, content, event_date, start_date, end_date, metadata)
-                    VALUES (%s, %s, %s, %s::vector, %s, %s, %s, %s, %s::jsonb);
-                    """,
-                    (
-                        col_name,
-                        source_id or None,
-                        chunk_index,
-                        _vector_literal(vector),
-                        chunk_text,
-                        event_date,
-                        start_date,
-                        end_date,
-                        json.dumps(metadata, ensure_ascii=False),
-                    ),
-                )
+            _write_doc_rows(cur, col_name, source_ids, rows)
         conn.commit()
+    return len(prepared_docs)
+
+
+def create_docs_upsert_isolated(
+    client: PGVectorClient,
+    col_name: str,
+    data_list: List[Dict[str, Any]],
+) -> tuple[int, List[tuple[Dict[str, Any], Exception]]]:
+    """
+    create_docs_upsert로 배치를 적재하고, 배치가 실패하면 문서별로 다시 적재해 실패한 문서만 골라낸다.
+    배치는 하나의 트랜잭션이라 실패 시 아무것도 쓰이지 않으므로 문서별 재시도가 안전하다.
+    (적재된 문서 수, [(실패한 문서, 예외)])를 반환한다.
+    """
+    try:
+        return create_docs_upsert(client, col_name, data_list), []
+    except Exception as batch_error:
+        if len(data_list) <= 1:
+            return 0, [(data, batch_error) for data in data_list]
+
+    uploaded = 0
+    failures: List[tuple[Dict[str, Any], Exception]] = []
+    for data in data_list:
+        try:
+            uploaded += create_docs_upsert(client, col_name, [data])
+        except Exception as e:
+            failures.append((data, e))
+    return uploaded, failures
 
 
 def read_doc(client: PGVectorClient, col_name: str, source_id: str) -> Optional[Dict[str, Any]]:
@@ -330,8 +546,11 @@ def search_doc(
     end_date: Optional[date] = None,
     entity_ids: Optional[List[str]] = None,
     metadata_filters: Optional[Dict[str, Any]] = None,
+    query_vector: Optional[List[float]] = None,
 ) -> List[SearchHit]:
-    query_vector = embed_query(query)
+    # 같은 질의로 여러 컬렉션을 검색하는 호출자는 미리 계산한 임베딩을 넘겨 재계산을 건너뛴다.
+    if query_vector is None:
+        query_vector = embed_query(query)
     if not query_vector:
         return []
 
@@ -440,30 +659,8 @@ def search_doc_by_entities(
     )
 
 
-def fetch_full_doc_by_source(
-    client: PGVectorClient,
-    col_name: str,
-    source_id: str,
-    max_chunks: int = 600,
-) -> Optional[Dict[str, Any]]:
-    table = _safe_ident(PGVECTOR_TABLE)
-    with client.connect() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT id, chunk_index, content, metadata, event_date, start_date, end_date
-                FROM {table}
-                WHERE collection = %s AND source_id = %s
-                ORDER BY chunk_index ASC
-                LIMIT %s;
-                """,
-                (col_name, str(source_id), int(max_chunks)),
-            )
-            rows = cur.fetchall()
-
-    if not rows:
-        return None
-
+def _build_full_doc(col_name: str, source_id: str, rows: List[Any]) -> Dict[str, Any]:
+    # rows: (id, chunk_index, content, metadata, event_date, start_date, end_date), chunk_index 오름차순
     first_meta = rows[0][3] if isinstance(rows[0][3], dict) else {}
     metadata = dict(first_meta)
     metadata["event_date"] = rows[0][4].isoformat() if rows[0][4] else metadata.get("event_date")
@@ -482,9 +679,94 @@ def fetch_full_doc_by_source(
     }
 
 
+def fetch_full_docs_by_sources(
+    client: PGVectorClient,
+    sources: List[tuple[str, str]],
+    max_chunks: int = 600,
+    max_chars: Optional[int] = None,
+) -> Dict[tuple[str, str], Dict[str, Any]]:
+    """
+    여러 (collection, source_id) 문서를 한 번의 쿼리로 조회한다.
+    문서별로 커넥션/쿼리를 반복하지 않도록 UNNEST 조인 + 문서 단위 window로 묶는다.
+    """
+    wanted: List[tuple[str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for col_name, source_id in sources:
+        key = (str(col_name), str(source_id))
+        if key in seen:
+            continue
+        seen.add(key)
+        wanted.append(key)
+    if not wanted:
+        return {}
+
+    table = _safe_ident(PGVECTOR_TABLE)
+    # metadata는 모든 chunk에 동일하게 저장되므로 문서별 첫 chunk에서만 전송한다.
+    # max_chars가 주어지면 앞선 chunk 누적 길이가 이를 넘는 chunk는 DB에서 바로 잘라낸다.
+    params: List[Any] = [[item[0] for item in wanted], [item[1] for item in wanted], int(max_chunks)]
+    char_limit_clause = ""
+    if max_chars is not None and int(max_chars) > 0:
+        char_limit_clause = "AND prior_chars < %s"
+        params.append(int(max_chars))
+    with client.connect() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT collection, source_id, id, chunk_index, content,
+                       CASE WHEN chunk_rank = 1 THEN metadata END AS metadata,
+                       event_date, start_date, end_date
+                FROM (
+                    SELECT d.collection, d.source_id, d.id, d.chunk_index, d.content, d.metadata,
+                           d.event_date, d.start_date, d.end_date,
+                           ROW_NUMBER() OVER doc_chunks AS chunk_rank,
+                           COALESCE(
+                               SUM(LENGTH(d.content)) OVER (
+                                   doc_chunks ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                               ),
+                               0
+                           ) AS prior_chars
+                    FROM {table} d
+                    JOIN UNNEST(%s::text[], %s::text[]) AS wanted(collection, source_id)
+                      ON d.collection = wanted.collection AND d.source_id = wanted.source_id
+                    WINDOW doc_chunks AS (PARTITION BY d.collection, d.source_id ORDER BY d.chunk_index ASC)
+                ) chunks
+                WHERE chunk_rank <= %s
+                {char_limit_clause}
+                ORDER BY collection, source_id, chunk_index ASC;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+    rows_by_source: Dict[tuple[str, str], List[Any]] = {}
+    for row in rows:
+        rows_by_source.setdefault((str(row[0]), str(row[1])), []).append(row[2:])
+    return {
+        key: _build_full_doc(key[0], key[1], doc_rows)
+        for key, doc_rows in rows_by_source.items()
+    }
+
+
+def fetch_full_doc_by_source(
+    client: PGVectorClient,
+    col_name: str,
+    source_id: str,
+    max_chunks: int = 600,
+    max_chars: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    docs = fetch_full_docs_by_sources(
+        client,
+        [(col_name, str(source_id))],
+        max_chunks=max_chunks,
+        max_chars=max_chars,
+    )
+    return docs.get((str(col_name), str(source_id)))
+
+
 def fetch_full_doc_by_chunk_id(
     client: PGVectorClient,
     chunk_id: int,
+    max_chars: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     table = _safe_ident(PGVECTOR_TABLE)
     with client.connect() as conn:
@@ -505,7 +787,12 @@ def fetch_full_doc_by_chunk_id(
 
     source_id = row[2]
     if source_id:
-        return fetch_full_doc_by_source(client, col_name=row[1], source_id=str(source_id))
+        return fetch_full_doc_by_source(
+            client,
+            col_name=row[1],
+            source_id=str(source_id),
+            max_chars=max_chars,
+        )
 
     metadata = row[5] if isinstance(row[5], dict) else {}
     payload = dict(metadata)
@@ -524,7 +811,14 @@ def fetch_full_doc_by_chunk_id(
     }
 
 
-def upsert_folder(client: PGVectorClient, folder_path: str, col_name: str, n: int = 0) -> None:
+def upsert_folder(
+    client: PGVectorClient,
+    folder_path: str,
+    col_name: str,
+    n: int = 0,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    max_workers: int = UPSERT_WORKERS,
+) -> None:
     if not os.path.exists(folder_path):
         print(f"Error: Folder path {folder_path} does not exist")
         return
@@ -535,14 +829,45 @@ def upsert_folder(client: PGVectorClient, folder_path: str, col_name: str, n: in
         return
 
     limit = n if n > 0 else len(json_files)
-    for idx, filename in enumerate(json_files[:limit], start=1):
+    docs: Dict[Any, Dict[str, Any]] = {}
+    for idx, filename in enumerate(json_files[:limit]):
         file_path = os.path.join(folder_path, filename)
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
             if "id" not in data:
                 data["id"] = os.path.splitext(filename)[0]
-            create_doc_upsert(client, col_name, data)
-            print(f"Uploaded {idx}/{limit}: {filename} -> {col_name}")
         except Exception as e:
             print(f"Error processing {filename}: {e}")
+            continue
+        # 배치를 동시에 적재하므로 같은 source_id는 미리 하나(마지막 파일)로 합쳐
+        # 서로 다른 배치가 같은 문서를 지우고 쓰며 충돌하지 않게 한다.
+        key = _doc_source_id(data) or idx
+        docs.pop(key, None)
+        docs[key] = data
+
+    doc_list = list(docs.values())
+    if not doc_list:
+        return
+
+    batch_size = max(1, batch_size)
+    batches = [doc_list[start:start + batch_size] for start in range(0, len(doc_list), batch_size)]
+    total = len(doc_list)
+    uploaded_total = 0
+
+    # 배치마다 임베딩 API와 DB 왕복이 독립적이므로 여러 배치를 동시에 보낸다.
+    # 배치 하나가 실패하면 문서별로 다시 적재해, 문제 문서 하나 때문에 나머지가 빠지지 않게 한다.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(create_docs_upsert_isolated, client, col_name, batch) for batch in batches]
+        for batch_index, future in enumerate(futures):
+            batch_start = batch_index * batch_size
+            batch_end = batch_start + len(batches[batch_index])
+            try:
+                uploaded, failures = future.result()
+            except Exception as e:
+                print(f"Error uploading batch {batch_start + 1}-{batch_end} -> {col_name}: {e}")
+                continue
+            uploaded_total += uploaded
+            for data, error in failures:
+                print(f"Error uploading {_doc_source_id(data)} -> {col_name}: {error}")
+            print(f"Uploaded {batch_end}/{total}: {uploaded_total} docs -> {col_name}")
@@ -2,11 +2,11 @@ from pathlib import Path
 
 try:
     from .drive2db import drive_upsert_all
-    from .vector_db_helper import get_pgvector_client, ensure_schema, search_doc
+    from .vector_db_helper import get_pgvector_client, ensure_schema, search_doc, bulk_load
     from .init import init_recreate_collections, init_upsertall
 except ImportError:
     from drive2db import drive_upsert_all  # type: ignore
-    from vector_db_helper import get_pgvector_client, ensure_schema, search_doc  # type: ignore
+    from vector_db_helper import get_pgvector_client, ensure_schema, search_doc, bulk_load  # type: ignore
     from init import init_recreate_collections, init_upsertall  # type: ignore
 
 
@@ -22,8 +22,10 @@ def main():
 
     if INIT:
         init_recreate_collections(client)
-        init_upsertall(client, str(FOLDER_PATH) + "/")
-        drive_upsert_all(client, str(DRIVE_LIST_PATH))
+        # 전체 재적재는 인덱스를 내려둔 채로 적재하고 마지막에 한 번만 만든다.
+        with bulk_load(client):
+            init_upsertall(client, str(FOLDER_PATH) + "/")
+            drive_upsert_all(client, str(DRIVE_LIST_PATH))
 
     results = search_doc(client, "몰입캠프", "notion.marketing", 2)
     for hit in results:
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# backend 패키지를 src 아래에서 바로 import할 수 있도록 경로를 추가한다.
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
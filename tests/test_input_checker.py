@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from backend.llm.inputChecker import OpenAIInputChecker
+
+
+EXAMPLES = [
+    {"input": "전산학부 졸업 요건 알려줘", "output": {"is_valid": True}},
+    {"input": "전산학부 졸업 학점은 몇 학점이야", "output": {"is_valid": True}},
+    {"input": "전산학부 행사 일정", "output": {"is_valid": True}},
+    {"input": "오늘 점심 메뉴 추천해줘", "output": {"is_valid": False}},
+    {"input": "주식 투자 방법 알려줘", "output": {"is_valid": False}},
+]
+
+
+@pytest.fixture
+def make_checker(tmp_path, monkeypatch):
+    config_path = tmp_path / "inputchecker.json"
+    config_path.write_text(json.dumps({"examples": EXAMPLES}, ensure_ascii=False), encoding="utf-8")
+
+    def factory(top_k: int) -> OpenAIInputChecker:
+        monkeypatch.setenv("CHECKER_FEW_SHOT_TOP_K", str(top_k))
+        return OpenAIInputChecker(api_key="test-key", config_path=str(config_path))
+
+    return factory
+
+
+def selected_inputs(checker: OpenAIInputChecker, message: str):
+    messages = checker._select_few_shot_messages(message)
+    return [m["content"] for m in messages if m["role"] == "user"]
+
+
+def test_few_shot_selection_prefers_similar_examples(make_checker):
+    checker = make_checker(top_k=3)
+
+    inputs = selected_inputs(checker, "전산학부 졸업 요건이 궁금해")
+
+    assert "전산학부 졸업 요건 알려줘" in inputs
+    assert "전산학부 졸업 학점은 몇 학점이야" in inputs
+
+
+def test_few_shot_selection_adds_missing_label_without_dropping_best_match(make_checker):
+    checker = make_checker(top_k=1)
+
+    inputs = selected_inputs(checker, "전산학부 졸업 요건 알려줘")
+
+    # 가장 가까운 예시는 유지하고, 빠진 false 레이블 예시를 덧붙인다.
+    assert inputs[0] == "전산학부 졸업 요건 알려줘"
+    assert len(inputs) == 2
+    labels = {
+        example["output"]["is_valid"] for example in EXAMPLES if example["input"] in inputs
+    }
+    assert labels == {True, False}
+
+
+def test_few_shot_selection_keeps_original_order(make_checker):
+    checker = make_checker(top_k=2)
+
+    inputs = selected_inputs(checker, "점심 메뉴와 졸업 요건")
+    order = [example["input"] for example in EXAMPLES]
+
+    assert inputs == sorted(inputs, key=order.index)
+
+
+def test_few_shot_selection_returns_all_when_top_k_disabled(make_checker):
+    checker = make_checker(top_k=0)
+
+    assert selected_inputs(checker, "아무 질문") == [example["input"] for example in EXAMPLES]
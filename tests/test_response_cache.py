@@ -0,0 +1,170 @@
+import math
+
+import pytest
+
+from backend.llm import response_cache
+from backend.llm.response_cache import LLMResponseCache, SemanticSearchCache, normalize_cache_text
+
+
+class FakeClock:
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache.time, "monotonic", fake)
+    return fake
+
+
+def unit_at(cos_sim: float):
+    """[1, 0]과의 코사인 유사도가 cos_sim인 2차원 벡터"""
+    return [cos_sim, math.sqrt(max(0.0, 1.0 - cos_sim * cos_sim))]
+
+
+def test_normalize_cache_text_collapses_whitespace():
+    assert normalize_cache_text("  전산학부\n 졸업   요건 ") == "전산학부 졸업 요건"
+    assert normalize_cache_text(None) == ""
+
+
+def test_llm_cache_hit_and_deep_copy_isolation(clock):
+    cache = LLMResponseCache(max_entries=4, ttl_sec=60)
+    original = {"keywords": ["졸업"]}
+    cache.set("key", original)
+    original["keywords"].append("변경")
+
+    first = cache.get("key")
+    assert first == {"keywords": ["졸업"]}
+    first["keywords"].append("호출자 수정")
+    assert cache.get("key") == {"keywords": ["졸업"]}
+
+
+def test_llm_cache_ttl_expiry(clock):
+    cache = LLMResponseCache(max_entries=4, ttl_sec=10)
+    cache.set("key", "value")
+
+    clock.now += 9.9
+    assert cache.get("key") == "value"
+    clock.now += 0.1
+    assert cache.get("key") is None
+
+
+def test_llm_cache_lru_eviction(clock):
+    cache = LLMResponseCache(max_entries=2, ttl_sec=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 올린다.
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_llm_cache_disabled_when_ttl_or_size_is_zero():
+    for cache in (LLMResponseCache(max_entries=0, ttl_sec=60), LLMResponseCache(max_entries=4, ttl_sec=0)):
+        cache.set("key", "value")
+        assert not cache.enabled
+        assert cache.get("key") is None
+
+
+def test_semantic_cache_is_disabled_without_threshold(monkeypatch):
+    monkeypatch.delenv("VECTOR_SEMANTIC_CACHE_THRESHOLD", raising=False)
+    cache = SemanticSearchCache()
+
+    assert not cache.enabled
+    # 연도만 다른 두 질의처럼 임베딩이 거의 같아도 다른 질의의 결과를 돌려주면 안 된다.
+    cache.set("scope", [1.0, 0.0, 0.0], [{"doc_id": "2024 학사일정"}])
+    assert cache.get("scope", [0.999, 0.04, 0.0]) is None
+
+
+def test_semantic_cache_threshold_from_env(monkeypatch):
+    monkeypatch.setenv("VECTOR_SEMANTIC_CACHE_THRESHOLD", "0.97")
+
+    assert SemanticSearchCache().threshold == pytest.approx(0.97)
+
+
+def test_semantic_cache_does_not_mix_distinct_queries():
+    cache = SemanticSearchCache(threshold=0.99, max_entries=8, ttl_sec=60)
+    cache.set("scope", [1.0, 0.0, 0.0], ["first"])
+    cache.set("scope", [0.0, 1.0, 0.0], ["second"])
+
+    assert cache.get("scope", [1.0, 0.0, 0.0]) == ["first"]
+    assert cache.get("scope", [0.0, 1.0, 0.0]) == ["second"]
+    # 두 저장 벡터 사이(유사도 약 0.71)의 질의는 어느 쪽에도 적중하지 않는다.
+    assert cache.get("scope", [1.0, 1.0, 0.0]) is None
+
+
+def test_semantic_cache_hit_and_miss_at_threshold():
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=60)
+    cache.set("scope", [2.0, 0.0], ["stored"])  # 길이와 무관하게 방향으로 비교한다.
+
+    assert cache.get("scope", unit_at(0.95)) == ["stored"]
+    assert cache.get("scope", unit_at(0.9001)) == ["stored"]
+    assert cache.get("scope", unit_at(0.8999)) is None
+
+
+def test_semantic_cache_separates_scopes():
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=60)
+    cache.set(("2024-01-01", None), [1.0, 0.0], ["january"])
+
+    assert cache.get(("2024-02-01", None), [1.0, 0.0]) is None
+
+
+def test_semantic_cache_ttl_expiry(clock):
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=10)
+    cache.set("scope", [1.0, 0.0], ["stored"])
+
+    clock.now += 9.9
+    assert cache.get("scope", [1.0, 0.0]) == ["stored"]
+    clock.now += 0.1
+    assert cache.get("scope", [1.0, 0.0]) is None
+    assert not cache._entries
+
+
+def test_semantic_cache_lru_eviction():
+    cache = SemanticSearchCache(threshold=0.99, max_entries=2, ttl_sec=60)
+    cache.set("scope", [1.0, 0.0, 0.0], ["a"])
+    cache.set("scope", [0.0, 1.0, 0.0], ["b"])
+    assert cache.get("scope", [1.0, 0.0, 0.0]) == ["a"]  # a를 최근 사용으로 올린다.
+    cache.set("scope", [0.0, 0.0, 1.0], ["c"])
+
+    assert cache.get("scope", [0.0, 1.0, 0.0]) is None
+    assert cache.get("scope", [1.0, 0.0, 0.0]) == ["a"]
+    assert cache.get("scope", [0.0, 0.0, 1.0]) == ["c"]
+
+
+def test_semantic_cache_dimension_mismatch():
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=60)
+    cache.set("scope", [1.0, 0.0, 0.0], ["three"])
+
+    # 임베딩 모델이 바뀌어 차원이 달라져도 예외 없이 미스로 처리한다.
+    assert cache.get("scope", [1.0, 0.0, 0.0, 0.0]) is None
+    cache.set("scope", [1.0, 0.0, 0.0, 0.0], ["four"])
+    assert cache.get("scope", [1.0, 0.0, 0.0]) == ["three"]
+    assert cache.get("scope", [1.0, 0.0, 0.0, 0.0]) == ["four"]
+
+
+def test_semantic_cache_ignores_empty_and_zero_vectors():
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=60)
+    cache.set("scope", [0.0, 0.0], ["zero"])
+    cache.set("scope", [], ["empty"])
+
+    assert not cache._entries
+    assert cache.get("scope", [0.0, 0.0]) is None
+
+
+def test_semantic_cache_deep_copy_isolation():
+    cache = SemanticSearchCache(threshold=0.9, max_entries=8, ttl_sec=60)
+    results = [{"doc_id": "a", "metadata": {"title": "원본"}}]
+    cache.set("scope", [1.0, 0.0], results)
+    results[0]["metadata"]["title"] = "저장 후 수정"
+
+    hit = cache.get("scope", [1.0, 0.0])
+    assert hit[0]["metadata"]["title"] == "원본"
+    hit[0]["metadata"]["title"] = "호출자 수정"
+    assert cache.get("scope", [1.0, 0.0])[0]["metadata"]["title"] == "원본"